@@ -0,0 +1,158 @@
+"""
+Batch API endpoint - many sub-requests in one round trip
+"""
+import asyncio
+import json
+import re
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import shared_session
+from app.core.loader import get_loader
+from app.models import Project, Task, User
+from app.schemas.batch import BatchOperation, BatchRequest, BatchResponse, BatchResult
+
+router = APIRouter()
+
+ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE"}
+
+# Entity ids a sub-request will look up: the one in its path, and references in its body
+ENTITY_PATH = re.compile(r"^/(tasks|projects|users)/(\d+)/?$")
+PATH_MODELS = {"tasks": Task, "projects": Project, "users": User}
+REFERENCE_MODELS = {"project_id": Project, "assignee_id": User, "owner_id": User}
+
+# Set by _dispatch itself
+FORCED_HEADERS = {"accept", "content-type", "content-length"}
+
+
+class _RollbackBatch(Exception):
+    """Raised inside an atomic batch to roll it back"""
+
+
+def _prefetch(db: Session, operations: List[BatchOperation]) -> None:
+    """
+    Queue every entity id the batch references with the session's loaders,
+    so the first get_by_id per model fetches them all in one IN query.
+    """
+    for operation in operations:
+        match = ENTITY_PATH.match(urlsplit(operation.path).path)
+        if match:
+            get_loader(db, PATH_MODELS[match.group(1)]).defer(int(match.group(2)))
+        if isinstance(operation.body, dict):
+            for field, model in REFERENCE_MODELS.items():
+                value = operation.body.get(field)
+                if isinstance(value, int):
+                    get_loader(db, model).defer(value)
+
+
+async def _dispatch(app, operation: BatchOperation) -> BatchResult:
+    """Run one sub-request through the app in-process"""
+    url = urlsplit(operation.path)
+    body = b"" if operation.body is None else json.dumps(operation.body).encode()
+    # Results are embedded in a JSON array, so JSON is forced; caller-supplied
+    # Accept and body framing headers are replaced rather than shadowing ours
+    headers: List[Tuple[bytes, bytes]] = [
+        (k.lower().encode(), v.encode()) for k, v in operation.headers.items()
+        if k.lower() not in FORCED_HEADERS
+    ]
+    headers.append((b"accept", b"application/json"))
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": operation.method.upper(),
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": None,
+        "server": None,
+    }
+
+    sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            # Like a real server, only report a disconnect once the response
+            # is out; middleware that listens for one would cut it short
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 500
+    content_type = ""
+    chunks = []
+
+    async def send(message):
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for key, value in message.get("headers", []):
+                if key.lower() == b"content-type":
+                    content_type = value.decode()
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # ServerErrorMiddleware has already sent a 500 start message
+        return BatchResult(status=500, body={"detail": "Internal Server Error"})
+
+    raw = b"".join(chunks)
+    if not raw:
+        payload = None
+    elif content_type.startswith("application/json"):
+        payload = json.loads(raw)
+    else:
+        payload = raw.decode(errors="replace")
+    return BatchResult(status=status, body=payload)
+
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(batch: BatchRequest, request: Request):
+    """
+    Run sub-requests in order on one session and one DB connection.
+    Entity lookups across all sub-requests are batched per model.
+    With atomic=true they share one transaction: the first failure stops
+    the batch and rolls back everything before it.
+    """
+    if len(batch.operations) > settings.BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch is limited to {settings.BATCH_MAX_OPERATIONS} operations"
+        )
+    for operation in batch.operations:
+        if operation.method.upper() not in ALLOWED_METHODS:
+            raise HTTPException(status_code=400, detail=f"Unsupported method {operation.method}")
+        if urlsplit(operation.path).path.rstrip("/") == "/batch":
+            raise HTTPException(status_code=400, detail="Batches cannot be nested")
+
+    results: List[BatchResult] = []
+    try:
+        with shared_session(atomic=batch.atomic) as db:
+            _prefetch(db, batch.operations)
+            for operation in batch.operations:
+                result = await _dispatch(request.app, operation)
+                results.append(result)
+                if batch.atomic and result.status >= 400:
+                    raise _RollbackBatch()
+    except _RollbackBatch:
+        return BatchResponse(committed=False, results=results)
+
+    return BatchResponse(committed=True, results=results)
@@ -1,46 +1,64 @@
 """
 Project API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.fields import parse_fields, pick_fields, sparse_response
+from app.core.formats import encoded_response, negotiate_format
+from app.models.project import ProjectStatus
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.user_repository import UserRepository
+from app.services.archive_service import ArchiveService
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 
 router = APIRouter()
 
+# Computed response fields for sparse fieldsets
+PROJECT_COMPUTED_FIELDS = {"task_count": lambda p: p.task_count()}
+
+# Column types for row-encoded responses, in ProjectResponse order
+PROJECT_COLUMNS = [
+    ("id", int),
+    ("name", str),
+    ("description", str),
+    ("status", ProjectStatus),
+    ("owner_id", int),
+    ("created_at", datetime),
+    ("updated_at", datetime),
+    ("task_count", int),
+]
+
 
 @router.get("/", response_model=List[ProjectResponse])
-def list_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_projects(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """List all projects with pagination"""
     repo = ProjectRepository(db)
-    projects = repo.get_all(skip=skip, limit=limit)
-    # Add task count to response
-    return [
-        ProjectResponse(
-            id=p.id,
-            name=p.name,
-            description=p.description,
-            status=p.status,
-            owner_id=p.owner_id,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-            task_count=p.task_count()
-        )
-        for p in projects
-    ]
+    selected = parse_fields(fields, ProjectResponse)
+    columns = [c for c in PROJECT_COLUMNS if selected is None or c[0] in selected]
+    batches = repo.iter_row_batches([name for name, _ in columns], skip=skip, limit=limit)
+    return encoded_response(negotiate_format(accept), columns, batches)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: int, db: Session = Depends(get_db)):
+def get_project(project_id: int, fields: Optional[str] = None, db: Session = Depends(get_db)):
     """Get a specific project by ID"""
     repo = ProjectRepository(db)
-    project = repo.get_by_id(project_id)
+    selected = parse_fields(fields, ProjectResponse)
+    project = repo.get_by_id(project_id, fields=selected)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    if selected:
+        return sparse_response(pick_fields(project, selected, PROJECT_COMPUTED_FIELDS))
     return ProjectResponse(
         id=project.id,
         name=project.name,
@@ -83,7 +101,12 @@ def update_project(project_id: int, project_data: ProjectUpdate, db: Session = D
     project = repo.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    updated = repo.update(project, project_data)
+    was_closed = project.status in (ProjectStatus.ARCHIVED, ProjectStatus.COMPLETED)
+    if was_closed and project_data.status == ProjectStatus.ACTIVE:
+        # Re-activated: bring its archived tasks back to the live table
+        updated = ArchiveService(db).reactivate_project(project, project_data)
+    else:
+        updated = repo.update(project, project_data)
     return ProjectResponse(
         id=updated.id,
         name=updated.name,
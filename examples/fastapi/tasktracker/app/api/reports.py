@@ -0,0 +1,61 @@
+"""
+Report API endpoints - project analytics
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.core.database import get_db
+from app.repositories.project_repository import ProjectRepository
+from app.schemas.report import BurndownPoint, CycleTimeStats, OverduePoint
+from app.services.report_service import ReportService
+
+router = APIRouter()
+
+
+def _require_project(project_id: int, db: Session) -> None:
+    """404 unless the project exists"""
+    if not ProjectRepository(db).get_by_id(project_id, fields=["id"]):
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
+@router.get("/projects/{project_id}/burndown", response_model=List[BurndownPoint])
+def project_burndown(
+    project_id: int,
+    days: int = Query(30, ge=1, le=365),
+    db: Session = Depends(get_db)
+):
+    """Open tasks per day for the last `days` days"""
+    _require_project(project_id, db)
+    return ReportService(db).burndown(project_id, days=days)
+
+
+@router.get("/projects/{project_id}/overdue", response_model=List[OverduePoint])
+def project_overdue_trend(
+    project_id: int,
+    days: int = Query(30, ge=1, le=365),
+    db: Session = Depends(get_db)
+):
+    """Overdue tasks per day for the last `days` days"""
+    _require_project(project_id, db)
+    return ReportService(db).overdue_trend(project_id, days=days)
+
+
+@router.get("/projects/{project_id}/cycle-time", response_model=List[CycleTimeStats])
+def project_cycle_time(
+    project_id: int,
+    percentiles: str = "50,90",
+    db: Session = Depends(get_db)
+):
+    """
+    Time-to-done percentiles (hours) per assignee.
+    percentiles is a comma-separated list, e.g. 50,75,95.
+    """
+    _require_project(project_id, db)
+    try:
+        values = [float(p) for p in percentiles.split(",") if p.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="percentiles must be numbers")
+    if not values or any(p < 0 or p > 100 for p in values):
+        raise HTTPException(status_code=400, detail="percentiles must be between 0 and 100")
+    return ReportService(db).cycle_time(project_id, percentiles=values)
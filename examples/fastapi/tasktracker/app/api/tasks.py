@@ -1,89 +1,154 @@
 """
 Task API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.fields import parse_fields, pick_fields, sparse_response
+from app.core.formats import encoded_response, negotiate_format
+from app.models.task import TaskPriority, TaskStatus
 from app.repositories.task_repository import TaskRepository
+from app.services.idempotency_service import IdempotencyService, request_fingerprint
 from app.services.task_service import TaskService
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.schemas.task import TaskCreate, TaskFilter, TaskResponse, TaskSort, TaskUpdate
 
 router = APIRouter()
 
+# Computed response fields for sparse fieldsets
+TASK_COMPUTED_FIELDS = {"is_overdue": lambda t: t.is_overdue()}
+
+# Column types for row-encoded responses, in TaskResponse order
+TASK_COLUMNS = [
+    ("id", int),
+    ("title", str),
+    ("description", str),
+    ("status", TaskStatus),
+    ("priority", TaskPriority),
+    ("project_id", int),
+    ("assignee_id", int),
+    ("due_date", datetime),
+    ("created_at", datetime),
+    ("updated_at", datetime),
+    ("is_overdue", bool),
+]
+
+
+def _task_columns(selected: Optional[List[str]]) -> list:
+    """Column spec restricted to the requested fields"""
+    if selected is None:
+        return TASK_COLUMNS
+    return [c for c in TASK_COLUMNS if c[0] in selected]
+
+
+def task_filters(
+    project_id: int = None,
+    assignee_id: int = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None
+) -> TaskFilter:
+    """Dependency collecting the list filters from query parameters"""
+    return TaskFilter(
+        project_id=project_id,
+        assignee_id=assignee_id,
+        status=status,
+        priority=priority,
+        due_after=due_after,
+        due_before=due_before
+    )
+
 
 @router.get("/", response_model=List[TaskResponse])
 def list_tasks(
-    project_id: int = None,
-    assignee_id: int = None,
+    filters: TaskFilter = Depends(task_filters),
+    sort: TaskSort = TaskSort.ID,
+    fields: Optional[str] = None,
+    include_archived: bool = False,
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """
     List tasks with optional filters.
-    Can filter by project_id or assignee_id.
+    Filters (project_id, assignee_id, status, priority, due_after,
+    due_before) combine with AND; sort by id, priority or due_date,
+    prefixed with - for descending. Without filters only 100 tasks are returned.
+    Pass fields=id,title,... to load and return only those fields.
+    Pass include_archived=true to also return archived tasks.
+    Honors Accept: application/msgpack and application/vnd.apache.arrow.stream.
     """
     repo = TaskRepository(db)
-
-    if project_id:
-        tasks = repo.get_by_project(project_id)
-    elif assignee_id:
-        tasks = repo.get_by_assignee(assignee_id)
-    else:
-        # Wart: No pagination on default list
-        tasks = repo.get_by_project(1) if False else []
-        # Actually get all - but this is expensive
-        from app.models.task import Task
-        tasks = db.query(Task).limit(100).all()
-
-    return [
-        TaskResponse(
-            id=t.id,
-            title=t.title,
-            description=t.description,
-            status=t.status,
-            priority=t.priority,
-            project_id=t.project_id,
-            assignee_id=t.assignee_id,
-            due_date=t.due_date,
-            created_at=t.created_at,
-            updated_at=t.updated_at,
-            is_overdue=t.is_overdue()
-        )
-        for t in tasks
-    ]
+    selected = parse_fields(fields, TaskResponse)
+    media_type = negotiate_format(accept)
+    columns = _task_columns(selected)
+    batches = repo.iter_row_batches(
+        [name for name, _ in columns],
+        filters=filters,
+        sort=sort,
+        # Wart: No pagination; only the unfiltered list is capped
+        limit=100 if filters == TaskFilter() else None,
+        include_archived=include_archived
+    )
+    return encoded_response(media_type, columns, batches)
 
 
 @router.get("/overdue", response_model=List[TaskResponse])
-def list_overdue_tasks(db: Session = Depends(get_db)):
+def list_overdue_tasks(
+    fields: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """Get all overdue tasks"""
     repo = TaskRepository(db)
-    tasks = repo.get_overdue()
-    return [
-        TaskResponse(
-            id=t.id,
-            title=t.title,
-            description=t.description,
-            status=t.status,
-            priority=t.priority,
-            project_id=t.project_id,
-            assignee_id=t.assignee_id,
-            due_date=t.due_date,
-            created_at=t.created_at,
-            updated_at=t.updated_at,
-            is_overdue=True
-        )
-        for t in tasks
-    ]
+    selected = parse_fields(fields, TaskResponse)
+    media_type = negotiate_format(accept)
+    columns = _task_columns(selected)
+    batches = repo.iter_row_batches(
+        [name for name, _ in columns], filters=TaskFilter(overdue=True)
+    )
+    return encoded_response(media_type, columns, batches)
+
+
+@router.get("/export", response_model=List[TaskResponse])
+def export_tasks(
+    filters: TaskFilter = Depends(task_filters),
+    sort: TaskSort = TaskSort.ID,
+    fields: Optional[str] = None,
+    include_archived: bool = False,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Export all matching tasks, without the list endpoint's 100 row cap.
+    Takes the same filters and sort orders as the list endpoint.
+    Rows are read in batches and encoded without building ORM objects.
+    """
+    repo = TaskRepository(db)
+    selected = parse_fields(fields, TaskResponse)
+    media_type = negotiate_format(accept)
+    columns = _task_columns(selected)
+    batches = repo.iter_row_batches(
+        [name for name, _ in columns],
+        filters=filters,
+        sort=sort,
+        include_archived=include_archived
+    )
+    return encoded_response(media_type, columns, batches)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(task_id: int, db: Session = Depends(get_db)):
-    """Get a specific task by ID"""
+def get_task(task_id: int, fields: Optional[str] = None, db: Session = Depends(get_db)):
+    """Get a specific task by ID, falling back to the archive"""
     repo = TaskRepository(db)
-    task = repo.get_by_id(task_id)
+    selected = parse_fields(fields, TaskResponse)
+    task = repo.get_by_id(task_id, fields=selected) or repo.get_archived(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    if selected:
+        return sparse_response(pick_fields(task, selected, TASK_COMPUTED_FIELDS))
     return TaskResponse(
         id=task.id,
         title=task.title,
@@ -100,43 +165,66 @@ def get_task(task_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=TaskResponse)
-def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
-    """Create a new task"""
-    service = TaskService(db)
-    task = service.create_task(task_data)
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        project_id=task.project_id,
-        assignee_id=task.assignee_id,
-        due_date=task.due_date,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        is_overdue=task.is_overdue()
-    )
+def create_task(
+    task_data: TaskCreate,
+    idempotency_key: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Create a new task.
+    Retries carrying the same Idempotency-Key get the original response.
+    """
+    def handler():
+        service = TaskService(db)
+        task = service.create_task(task_data)
+        return TaskResponse(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            priority=task.priority,
+            project_id=task.project_id,
+            assignee_id=task.assignee_id,
+            due_date=task.due_date,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            is_overdue=task.is_overdue()
+        )
+
+    fingerprint = request_fingerprint("POST", "/tasks/", task_data)
+    return IdempotencyService(db).execute(idempotency_key, fingerprint, handler)
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(task_id: int, task_data: TaskUpdate, db: Session = Depends(get_db)):
-    """Update an existing task"""
-    service = TaskService(db)
-    task = service.update_task_status(task_id, task_data)
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        project_id=task.project_id,
-        assignee_id=task.assignee_id,
-        due_date=task.due_date,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        is_overdue=task.is_overdue()
-    )
+def update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    idempotency_key: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Update an existing task.
+    Retries carrying the same Idempotency-Key get the original response.
+    """
+    def handler():
+        service = TaskService(db)
+        task = service.update_task_status(task_id, task_data)
+        return TaskResponse(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            status=task.status,
+            priority=task.priority,
+            project_id=task.project_id,
+            assignee_id=task.assignee_id,
+            due_date=task.due_date,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            is_overdue=task.is_overdue()
+        )
+
+    fingerprint = request_fingerprint("PUT", f"/tasks/{task_id}", task_data)
+    return IdempotencyService(db).execute(idempotency_key, fingerprint, handler)
 
 
 @router.delete("/{task_id}")
@@ -1,31 +1,54 @@
 """
 User API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.fields import parse_fields, pick_fields, sparse_response
+from app.core.formats import encoded_response, negotiate_format
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 
 router = APIRouter()
 
+# Column types for row-encoded responses, in UserResponse order
+USER_COLUMNS = [
+    ("id", int),
+    ("email", str),
+    ("name", str),
+    ("created_at", datetime),
+]
+
 
 @router.get("/", response_model=List[UserResponse])
-def list_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_users(
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """List all users with pagination"""
     repo = UserRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    selected = parse_fields(fields, UserResponse)
+    columns = [c for c in USER_COLUMNS if selected is None or c[0] in selected]
+    batches = repo.iter_row_batches([name for name, _ in columns], skip=skip, limit=limit)
+    return encoded_response(negotiate_format(accept), columns, batches)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(user_id: int, fields: Optional[str] = None, db: Session = Depends(get_db)):
     """Get a specific user by ID"""
     repo = UserRepository(db)
-    user = repo.get_by_id(user_id)
+    selected = parse_fields(fields, UserResponse)
+    user = repo.get_by_id(user_id, fields=selected)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    if selected:
+        return sparse_response(pick_fields(user, selected))
     return user
 
 
@@ -0,0 +1,25 @@
+"""
+Bulk inserts for seeding and backfills
+
+Rows go through Core executemany on the table, skipping the unit of work
+and identity map, in one transaction.
+"""
+from itertools import islice
+from typing import Iterable
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+
+def bulk_insert(db: Session, table: Table, rows: Iterable[dict], chunk_size: int = 10_000) -> int:
+    """Insert rows in chunks of chunk_size, commit once, return the row count"""
+    rows = iter(rows)
+    count = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        db.execute(insert(table), chunk)
+        count += len(chunk)
+    db.commit()
+    return count
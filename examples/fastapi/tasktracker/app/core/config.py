@@ -16,6 +16,38 @@ class Settings:
     # Notification settings - external webhook
     NOTIFICATION_WEBHOOK_URL: str = os.getenv("NOTIFICATION_WEBHOOK_URL", "")
     NOTIFICATION_ENABLED: bool = os.getenv("NOTIFICATION_ENABLED", "false").lower() == "true"
+    # Coalescing: 0 sends every event as its own webhook
+    NOTIFICATION_COALESCE_WINDOW_SECONDS: float = float(
+        os.getenv("NOTIFICATION_COALESCE_WINDOW_SECONDS", "0")
+    )
+    NOTIFICATION_BATCH_MAX_EVENTS: int = int(os.getenv("NOTIFICATION_BATCH_MAX_EVENTS", "100"))
+
+    # Overdue sweeper - background job emitting task.overdue events
+    OVERDUE_SWEEP_ENABLED: bool = os.getenv("OVERDUE_SWEEP_ENABLED", "false").lower() == "true"
+    OVERDUE_SWEEP_INTERVAL_SECONDS: int = int(os.getenv("OVERDUE_SWEEP_INTERVAL_SECONDS", "60"))
+    # "project" or "assignee": one webhook per group
+    OVERDUE_SWEEP_GROUP_BY: str = os.getenv("OVERDUE_SWEEP_GROUP_BY", "project")
+
+    # Task archival - moves DONE tasks of archived/completed projects to cold storage
+    ARCHIVE_ENABLED: bool = os.getenv("ARCHIVE_ENABLED", "false").lower() == "true"
+    ARCHIVE_INTERVAL_SECONDS: int = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+    ARCHIVE_CHUNK_SIZE: int = int(os.getenv("ARCHIVE_CHUNK_SIZE", "500"))
+
+    # Idempotency-Key support for task writes
+    IDEMPOTENCY_TTL_SECONDS: int = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: int = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT_SECONDS", "60"))
+
+    # Most sub-requests accepted by POST /batch
+    BATCH_MAX_OPERATIONS: int = int(os.getenv("BATCH_MAX_OPERATIONS", "50"))
+
+    # On-demand profiling: off unless a token or sample rate is set
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", "./profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", "50"))
+    # "pstats" (cProfile) or "collapsed" (sampled stacks, flame-graph input)
+    PROFILING_FORMAT: str = os.getenv("PROFILING_FORMAT", "pstats")
+    PROFILING_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", "1"))
 
     # Wart: Magic number for task limit, duplicated in TaskService
     MAX_TASKS_PER_PROJECT: int = 100
@@ -1,11 +1,16 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.core.loader import enable_loaders
 
 # Wart: No connection pooling configured for SQLite
 engine = create_engine(
@@ -17,14 +22,94 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Set while a batch runs, so every get_db() in it shares one session
+_shared_session: ContextVar[Optional[Session]] = ContextVar("shared_session", default=None)
+
+# Side effects held back until an atomic shared session's outer transaction commits
+ON_COMMIT_KEY = "on_commit"
+
 
 def get_db():
     """
     Dependency that provides database session.
     Yields session and ensures cleanup.
     """
-    db = SessionLocal()
+    shared = _shared_session.get()
+    if shared is not None:
+        # Owned by shared_session(), which closes it
+        yield shared
+        return
+
+    db = enable_loaders(SessionLocal())
     try:
         yield db
     finally:
         db.close()
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@contextmanager
+def _sqlite_savepoints(connection) -> Iterator[None]:
+    """
+    pysqlite manages transactions itself and breaks SAVEPOINT; hand control
+    back to SQLAlchemy for this one connection only, so ordinary reads
+    elsewhere don't hold SQLite locks.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    previous = dbapi_connection.isolation_level
+    dbapi_connection.isolation_level = None
+    event.listen(connection, "begin", _emit_begin)
+    try:
+        yield
+    finally:
+        event.remove(connection, "begin", _emit_begin)
+        dbapi_connection.isolation_level = previous
+
+
+def on_commit(db: Optional[Session], callback: Callable[[], None]) -> None:
+    """
+    Run callback once db's work is durable: immediately, or after the outer
+    transaction of an atomic shared session commits. Dropped on rollback.
+    """
+    callbacks = db.info.get(ON_COMMIT_KEY) if db is not None else None
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+@contextmanager
+def shared_session(atomic: bool = False) -> Iterator[Session]:
+    """
+    One session on one checked-out connection for everything in this context.
+    With atomic=True, repository commits only release savepoints; the outer
+    transaction commits on normal exit and rolls back if an exception escapes.
+    Callbacks registered with on_commit() run only after the outer commit.
+    """
+    with ExitStack() as stack:
+        connection = stack.enter_context(engine.connect())
+        if atomic and engine.dialect.name == "sqlite":
+            stack.enter_context(_sqlite_savepoints(connection))
+        transaction = connection.begin() if atomic else None
+        db = enable_loaders(
+            SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+        )
+        if atomic:
+            db.info[ON_COMMIT_KEY] = []
+        token = _shared_session.set(db)
+        try:
+            yield db
+            if transaction is not None:
+                transaction.commit()
+                for callback in db.info.pop(ON_COMMIT_KEY):
+                    callback()
+        except BaseException:
+            if transaction is not None:
+                transaction.rollback()
+            raise
+        finally:
+            _shared_session.reset(token)
+            db.close()
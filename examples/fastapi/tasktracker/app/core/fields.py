@@ -0,0 +1,72 @@
+"""
+Sparse fieldset support - the ?fields= query parameter
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated ?fields= value against a response schema.
+    Returns None when no fields were requested, meaning the full response.
+    """
+    if not fields:
+        return None
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in schema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+
+    # id is always returned so clients can correlate rows
+    return list(dict.fromkeys(["id"] + requested))
+
+
+def load_only_options(
+    model: Any,
+    fields: Optional[Iterable[str]],
+    derived: Optional[Dict[str, Iterable[str]]] = None
+) -> list:
+    """
+    Build query options that load only the columns behind the requested fields.
+    `derived` maps computed response fields to the columns they are built from.
+    """
+    if fields is None:
+        return []
+
+    derived = derived or {}
+    columns = model.__table__.columns.keys()
+    wanted = set()
+    for field in fields:
+        wanted.update(derived.get(field, (field,)))
+    attrs = [getattr(model, name) for name in columns if name in wanted]
+    return [load_only(*attrs)] if attrs else []
+
+
+def pick_fields(
+    obj: Any,
+    fields: Iterable[str],
+    computed: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> Dict[str, Any]:
+    """Copy the requested fields off an ORM object, evaluating computed ones"""
+    computed = computed or {}
+    return {
+        f: computed[f](obj) if f in computed else getattr(obj, f)
+        for f in fields
+    }
+
+
+def sparse_response(content: Any) -> JSONResponse:
+    """
+    Return trimmed content as-is.
+    Bypasses response_model validation, which would reject missing fields.
+    """
+    return JSONResponse(content=jsonable_encoder(content))
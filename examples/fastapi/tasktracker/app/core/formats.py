@@ -0,0 +1,216 @@
+"""
+Response format negotiation - JSON, MessagePack and Apache Arrow IPC
+
+Encoders work on plain column rows in batches, so list responses never
+build per-row ORM or Pydantic objects.
+"""
+import enum
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+# Accept header values mapped to the media type we answer with
+SUPPORTED_MEDIA_TYPES = {
+    "application/json": JSON,
+    "application/msgpack": MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.apache.arrow.stream": ARROW,
+}
+
+# Column spec: (name, python type or Enum class)
+Column = Tuple[str, Any]
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """
+    Pick a response media type from an Accept header.
+    Defaults to JSON; raises 406 if only unsupported types are acceptable.
+    """
+    if not accept:
+        return JSON
+
+    candidates = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(candidates):
+        if media_type in SUPPORTED_MEDIA_TYPES:
+            return SUPPORTED_MEDIA_TYPES[media_type]
+        if media_type in ("*/*", "application/*"):
+            return JSON
+
+    raise HTTPException(
+        status_code=406,
+        detail=f"Supported formats: {', '.join(sorted(set(SUPPORTED_MEDIA_TYPES.values())))}"
+    )
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """SQLite hands back naive datetimes; they are stored as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _enum_value(value: Optional[enum.Enum]) -> Any:
+    return value.value if value is not None else None
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _msgpack_converter(kind: Any) -> Optional[Callable[[Any], Any]]:
+    """Per-value conversion for types msgpack cannot pack natively"""
+    if isinstance(kind, type) and issubclass(kind, enum.Enum):
+        return _enum_value
+    if kind is datetime:
+        return _as_utc
+    return None
+
+
+def _json_converter(kind: Any) -> Optional[Callable[[Any], Any]]:
+    """Per-value conversion for types json cannot dump natively"""
+    if isinstance(kind, type) and issubclass(kind, enum.Enum):
+        return _enum_value
+    if kind is datetime:
+        return _isoformat
+    return None
+
+
+def row_dicts(
+    columns: Sequence[Column],
+    batches: Iterable[Sequence[Sequence[Any]]],
+    converter: Callable[[Any], Optional[Callable[[Any], Any]]]
+) -> list:
+    """Map row tuples straight to response dicts, converting only the columns that need it"""
+    names = [name for name, _ in columns]
+    converters = [(i, conv) for i, (_, kind) in enumerate(columns)
+                  if (conv := converter(kind)) is not None]
+
+    rows = []
+    for batch in batches:
+        for row in batch:
+            values = list(row)
+            for i, conv in converters:
+                values[i] = conv(values[i])
+            rows.append(dict(zip(names, values)))
+    return rows
+
+
+def encode_json(columns: Sequence[Column], batches: Iterable[Sequence[Sequence[Any]]]) -> bytes:
+    """Encode row batches as a JSON array of objects, shaped like the response models"""
+    rows = row_dicts(columns, batches, _json_converter)
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def encode_msgpack(columns: Sequence[Column], batches: Iterable[Sequence[Sequence[Any]]]) -> bytes:
+    """Encode row batches as a MessagePack array of maps, like the JSON body"""
+    try:
+        import msgpack
+    except ImportError:
+        raise HTTPException(status_code=406, detail="MessagePack support is not installed")
+
+    rows = row_dicts(columns, batches, _msgpack_converter)
+    # datetime=True packs timestamps with the native Timestamp extension
+    return msgpack.packb(rows, datetime=True)
+
+
+def _arrow_schema(pa, columns: Sequence[Column]):
+    """Arrow schema for a column spec"""
+    fields = []
+    for name, kind in columns:
+        if isinstance(kind, type) and issubclass(kind, enum.Enum):
+            arrow_type = pa.dictionary(pa.int8(), pa.string())
+        elif kind is datetime:
+            arrow_type = pa.timestamp("us", tz="UTC")
+        elif kind is bool:
+            arrow_type = pa.bool_()
+        elif kind is int:
+            arrow_type = pa.int64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _arrow_array(pa, kind: Any, values: Sequence[Any], arrow_type):
+    """Build one Arrow column from a batch of values"""
+    if isinstance(kind, type) and issubclass(kind, enum.Enum):
+        # Fixed dictionary per enum keeps it identical across stream batches
+        members = list(kind)
+        index = {member: i for i, member in enumerate(members)}
+        indices = pa.array([index.get(v) for v in values], type=pa.int8())
+        dictionary = pa.array([m.value for m in members], type=pa.string())
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+    if kind is datetime:
+        values = [_as_utc(v) for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+def iter_arrow_stream(
+    columns: Sequence[Column],
+    batches: Iterable[Sequence[Sequence[Any]]]
+) -> Iterator[bytes]:
+    """Encode row batches as an Arrow IPC stream, one record batch per DB batch"""
+    import pyarrow as pa
+
+    schema = _arrow_schema(pa, columns)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield _drain(sink)
+        for batch in batches:
+            if not batch:
+                continue
+            column_values = list(zip(*batch))
+            arrays = [
+                _arrow_array(pa, kind, column_values[i], schema.field(i).type)
+                for i, (_, kind) in enumerate(columns)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    """Take whatever the IPC writer has written so far"""
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def encoded_response(
+    media_type: str,
+    columns: Sequence[Column],
+    batches: Iterable[Sequence[Sequence[Any]]]
+) -> Response:
+    """Encode row batches in the negotiated format"""
+    if media_type == JSON:
+        return Response(content=encode_json(columns, batches), media_type=JSON)
+    if media_type == MSGPACK:
+        return Response(content=encode_msgpack(columns, batches), media_type=MSGPACK)
+    if media_type == ARROW:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=406, detail="Arrow support is not installed")
+        return StreamingResponse(iter_arrow_stream(columns, batches), media_type=ARROW)
+    raise ValueError(f"No encoder for {media_type}")
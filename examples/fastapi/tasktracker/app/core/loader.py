@@ -0,0 +1,110 @@
+"""
+Request-scoped entity loaders - batched, memoized primary key lookups
+
+get_db() attaches a loader registry to each request's session. Callers
+queue ids with defer(); the next get() fetches every queued id in one
+WHERE id IN (...) query, and found entities are memoized for the rest of
+the request. Misses are not memoized, so a row that appears later (e.g.
+restored from the archive) is still found. Sessions created outside a
+request have no registry, so repositories fall back to plain queries there.
+
+ORM inserts and deletes (including cascades) keep the memo current through
+session lifecycle events; Core writes call reset_loader().
+"""
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+LOADERS_KEY = "loaders"
+
+
+class EntityLoader:
+    """Batches and memoizes get-by-id lookups for one model in one session"""
+
+    # Keeps IN lists under SQLite's bound parameter limit
+    MAX_BATCH = 500
+
+    def __init__(self, db: Session, model: Any):
+        self.db = db
+        self.model = model
+        self._memo: Dict[int, Any] = {}
+        self._queue: set = set()
+
+    def defer(self, *ids: Optional[int]) -> None:
+        """Queue ids for the next dispatch"""
+        self._queue.update(i for i in ids if i is not None and i not in self._memo)
+
+    def get(self, entity_id: int) -> Optional[Any]:
+        """Load one entity, dispatching everything queued alongside it"""
+        if entity_id not in self._memo:
+            self.defer(entity_id)
+            self._dispatch()
+        return self._memo.get(entity_id)
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, Any]:
+        """Load several entities in one dispatch; missing ids are left out"""
+        ids = list(ids)
+        self.defer(*ids)
+        self._dispatch()
+        return {i: self._memo[i] for i in ids if i in self._memo}
+
+    def prime(self, entity: Any) -> None:
+        """Memoize an entity that was just created"""
+        self._memo[entity.id] = entity
+
+    def clear(self, entity_id: int) -> None:
+        """Forget an entity, e.g. after it was deleted"""
+        self._memo.pop(entity_id, None)
+
+    def _dispatch(self) -> None:
+        """Fetch all queued ids and memoize the ones found"""
+        queued, self._queue = sorted(self._queue), set()
+        for start in range(0, len(queued), self.MAX_BATCH):
+            chunk = queued[start:start + self.MAX_BATCH]
+            for entity in self.db.query(self.model).filter(self.model.id.in_(chunk)):
+                self._memo[entity.id] = entity
+
+
+def enable_loaders(db: Session) -> Session:
+    """Opt a session in to request-scoped loaders"""
+    db.info[LOADERS_KEY] = {}
+    return db
+
+
+def get_loader(db: Session, model: Any) -> Optional[EntityLoader]:
+    """The session's loader for a model, or None if the session didn't opt in"""
+    registry = db.info.get(LOADERS_KEY)
+    if registry is None:
+        return None
+    loader = registry.get(model)
+    if loader is None:
+        loader = registry[model] = EntityLoader(db, model)
+    return loader
+
+
+def reset_loader(db: Session, model: Any) -> None:
+    """Drop a model's memo after Core writes the session events don't see"""
+    registry = db.info.get(LOADERS_KEY)
+    if registry:
+        registry.pop(model, None)
+
+
+def _existing_loader(session: Session, instance: Any) -> Optional[EntityLoader]:
+    """The loader for an instance's model, only if one was already created"""
+    registry = session.info.get(LOADERS_KEY)
+    return registry.get(type(instance)) if registry else None
+
+
+@event.listens_for(Session, "pending_to_persistent")
+def _prime_inserted(session, instance):
+    loader = _existing_loader(session, instance)
+    if loader is not None:
+        loader.prime(instance)
+
+
+@event.listens_for(Session, "persistent_to_deleted")
+def _clear_deleted(session, instance):
+    loader = _existing_loader(session, instance)
+    if loader is not None:
+        loader.clear(instance.id)
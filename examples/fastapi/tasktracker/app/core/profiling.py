@@ -0,0 +1,303 @@
+"""
+On-demand request profiling
+
+A request is profiled when it carries X-Profile: <PROFILING_TOKEN>, or is
+picked by PROFILING_SAMPLE_RATE. Sync endpoints run in threadpool workers,
+so the profiler runs inside each endpoint call (in that worker thread)
+rather than around the middleware. Output goes to PROFILING_DIR as pstats
+or collapsed-stack files, plus a summary attributing time to routers,
+repositories, services, Pydantic and SQL.
+
+Only the endpoint function itself is captured: Pydantic time covers the
+models it builds, not FastAPI's request parsing or response_model
+validation, and dependencies such as get_db run outside the capture, as
+does streaming a response body. The summary's wall_seconds still spans
+the whole request up to the start of the response.
+
+Nothing is installed unless profiling is configured, so the disabled cost
+is zero.
+"""
+import cProfile
+import functools
+import hmac
+import inspect
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+_thread_state = threading.local()
+
+# Checked in order; the first match names the category
+CATEGORIES = [
+    ("sql", re.compile(r"sqlite3|sqlalchemy[/\\]engine|sqlalchemy[/\\]dialects|psycopg")),
+    ("pydantic", re.compile(r"pydantic")),
+    ("repositories", re.compile(r"app[/\\]repositories")),
+    ("services", re.compile(r"app[/\\]services")),
+    ("routers", re.compile(r"app[/\\]api")),
+    ("orm", re.compile(r"sqlalchemy")),
+]
+
+
+def _category(location: str) -> str:
+    for name, pattern in CATEGORIES:
+        if pattern.search(location):
+            return name
+    return "other"
+
+
+def _frame_label(code) -> str:
+    """Short, stable name for a code object in collapsed stacks"""
+    path = code.co_filename.replace("\\", "/")
+    for marker in ("site-packages/", "/app/"):
+        if marker in path:
+            path = path.split(marker, 1)[1]
+            if marker == "/app/":
+                path = "app/" + path
+            break
+    else:
+        path = os.path.basename(path)
+    return f"{path}:{code.co_name}"
+
+
+class ProfileSession:
+    """Profile data collected for one request, across the threads it ran in"""
+
+    def __init__(self, fmt: str, interval: float):
+        self.fmt = fmt
+        self.interval = interval
+        self.stats: Optional[pstats.Stats] = None
+        self.samples: Counter = Counter()
+        self._threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self._done = threading.Event()
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Profile the current thread for the duration of the block"""
+        if getattr(_thread_state, "profiling", False):
+            # Already inside a capture on this thread
+            yield
+            return
+
+        _thread_state.profiling = True
+        try:
+            if self.fmt == "collapsed":
+                with self._sampled():
+                    yield
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    yield
+                finally:
+                    profiler.disable()
+                    with self._lock:
+                        if self.stats is None:
+                            self.stats = pstats.Stats(profiler)
+                        else:
+                            self.stats.add(profiler)
+        finally:
+            _thread_state.profiling = False
+
+    @contextmanager
+    def _sampled(self) -> Iterator[None]:
+        """Register this thread with the stack sampler"""
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] = self._threads.get(ident, 0) + 1
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample, name="profile-sampler", daemon=True
+                )
+                self._sampler.start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._threads[ident] -= 1
+                if not self._threads[ident]:
+                    del self._threads[ident]
+
+    def _sample(self) -> None:
+        """Record the stacks of registered threads every interval"""
+        while not self._done.wait(self.interval):
+            with self._lock:
+                idents = list(self._threads)
+            frames = sys._current_frames()
+            for ident in idents:
+                frame = frames.get(ident)
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if stack:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def finish(self) -> None:
+        """Stop sampling"""
+        self._done.set()
+        if self._sampler is not None:
+            self._sampler.join()
+
+    def attribution(self) -> Dict[str, float]:
+        """Seconds (pstats) or sample counts (collapsed) per category"""
+        totals: Counter = Counter()
+        if self.fmt == "collapsed":
+            for stack, count in self.samples.items():
+                # Innermost frame that belongs to a known category wins
+                frames = stack.split(";")
+                category = next(
+                    (c for c in map(_category, reversed(frames)) if c != "other"), "other"
+                )
+                totals[category] += count
+        elif self.stats is not None:
+            for (filename, _, funcname), stat in self.stats.stats.items():
+                totals[_category(f"{filename} {funcname}")] += stat[2]
+        return {name: round(value, 6) for name, value in totals.most_common()}
+
+    def write(self, directory: str, stem: str) -> None:
+        """Write profile and summary files"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, stem)
+        if self.fmt == "collapsed":
+            with open(base + ".collapsed", "w") as f:
+                for stack, count in self.samples.items():
+                    f.write(f"{stack} {count}\n")
+        elif self.stats is not None:
+            self.stats.dump_stats(base + ".pstats")
+
+
+def _enforce_retention(directory: str, keep: int) -> None:
+    """Delete the oldest profiles beyond `keep`"""
+    summaries = sorted(
+        (f for f in os.listdir(directory) if f.endswith(".summary.json")),
+        key=lambda f: os.path.getmtime(os.path.join(directory, f))
+    )
+    for summary in summaries[:max(len(summaries) - keep, 0)]:
+        stem = summary[:-len(".summary.json")]
+        for suffix in (".summary.json", ".pstats", ".collapsed"):
+            path = os.path.join(directory, stem + suffix)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _should_profile(headers: Headers) -> bool:
+    token = headers.get(PROFILE_HEADER)
+    if token and settings.PROFILING_TOKEN and hmac.compare_digest(token, settings.PROFILING_TOKEN):
+        return True
+    return settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE
+
+
+def _profiled(call):
+    """Wrap a sync endpoint so it runs under the request's profile session"""
+    @functools.wraps(call)
+    def wrapper(*args, **kwargs):
+        session = _session.get()
+        if session is None:
+            return call(*args, **kwargs)
+        with session.capture():
+            return call(*args, **kwargs)
+    return wrapper
+
+
+class ProfilingMiddleware:
+    """
+    Plain ASGI middleware, so responses (and /batch sub-requests) are passed
+    through untouched. The profile is written when the response starts,
+    which is after the endpoint returned, and its id added as X-Profile-Id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _should_profile(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession(
+            settings.PROFILING_FORMAT, settings.PROFILING_SAMPLE_INTERVAL_MS / 1000
+        )
+        token = _session.set(session)
+        start = time.perf_counter()
+
+        async def send_profiled(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                session.finish()
+                stem = _write_profile(
+                    session, scope, message["status"], time.perf_counter() - start
+                )
+                if stem is not None:
+                    MutableHeaders(scope=message).append("X-Profile-Id", stem)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_profiled)
+        finally:
+            _session.reset(token)
+            session.finish()
+
+
+def _write_profile(
+    session: ProfileSession, scope: Scope, status: int, wall: float
+) -> Optional[str]:
+    """Write the profile and its summary, return the file stem"""
+    method, path = scope["method"], scope["path"]
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_") or "root"
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    stem = f"{stamp}-{method}-{slug}"
+    directory = settings.PROFILING_DIR
+    try:
+        session.write(directory, stem)
+        with open(os.path.join(directory, stem + ".summary.json"), "w") as f:
+            json.dump({
+                "method": method,
+                "path": path,
+                "status": status,
+                "wall_seconds": round(wall, 6),
+                "format": session.fmt,
+                "unit": "samples" if session.fmt == "collapsed" else "seconds",
+                "categories": session.attribution(),
+            }, f, indent=2)
+        _enforce_retention(directory, settings.PROFILING_MAX_FILES)
+    except OSError:
+        logger.exception("Failed to write profile")
+        return None
+    return stem
+
+
+def install_profiling(app: FastAPI) -> None:
+    """
+    Wrap sync endpoints and add the profiling middleware.
+    Call after all routers are included.
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not inspect.iscoroutinefunction(route.dependant.call):
+            # Async endpoints are left alone; the sync routes they call are profiled
+            route.dependant.call = _profiled(route.dependant.call)
+
+    app.add_middleware(ProfilingMiddleware)
@@ -1,5 +1,8 @@
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task
+from app.models.archived_task import ArchivedTask
+from app.models.job_state import JobState
+from app.models.idempotency_key import IdempotencyKey
 
-__all__ = ["User", "Project", "Task"]
+__all__ = ["User", "Project", "Task", "ArchivedTask", "JobState", "IdempotencyKey"]
@@ -0,0 +1,32 @@
+"""
+Archived task model - cold storage for finished work
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text
+
+from app.core.database import Base
+from app.models.task import TaskStatus, TaskPriority
+
+
+class ArchivedTask(Base):
+    """
+    DONE task moved out of the live tasks table because its project was
+    archived or completed. Keeps the original id so it can be moved back.
+    """
+
+    __tablename__ = "tasks_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(Enum(TaskStatus), default=TaskStatus.DONE)
+    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    due_date = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=True)
+
+    def is_overdue(self) -> bool:
+        """Archived tasks are finished, so never overdue"""
+        return False
@@ -0,0 +1,27 @@
+"""
+Idempotency key model - stored responses for retried writes
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """A client-supplied Idempotency-Key and the response it produced"""
+
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String, primary_key=True)
+    # Hash of method, path and body; a reused key must match it
+    fingerprint = Column(String, nullable=False)
+    # Null while the first request is still in flight
+    response_status = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def is_complete(self) -> bool:
+        """Whether a response has been stored"""
+        return self.response_status is not None
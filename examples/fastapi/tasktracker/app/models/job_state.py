@@ -0,0 +1,17 @@
+"""
+Job state model - persisted progress for background jobs
+"""
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class JobState(Base):
+    """Watermark for a background job, so restarts resume where it stopped"""
+
+    __tablename__ = "job_states"
+
+    name = Column(String, primary_key=True)
+    watermark = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,8 +1,8 @@
 """
 Project model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, select
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func
 import enum
 
@@ -25,20 +25,30 @@ class Project(Base):
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     status = Column(Enum(ProjectStatus), default=ProjectStatus.ACTIVE)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     owner = relationship("User", back_populates="projects")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+    archived_tasks = relationship("ArchivedTask", cascade="all, delete-orphan")
+
+    def _archived_task_count(self) -> int:
+        """COUNT over tasks_archive; loading archived_tasks would pull in every cold row"""
+        from app.models.archived_task import ArchivedTask
+        return object_session(self).scalar(
+            select(func.count(ArchivedTask.id)).where(ArchivedTask.project_id == self.id)
+        )
 
     def task_count(self) -> int:
-        """Get number of tasks in project"""
-        return len(self.tasks)
+        """Get number of tasks in project, archived ones included"""
+        return len(self.tasks) + self._archived_task_count()
 
     def completed_task_count(self) -> int:
         """Get number of completed tasks"""
         # Wart: imports TaskStatus here to avoid circular import
         from app.models.task import TaskStatus
-        return len([t for t in self.tasks if t.status == TaskStatus.DONE])
+        done = len([t for t in self.tasks if t.status == TaskStatus.DONE])
+        # Only DONE tasks are ever archived
+        return done + self._archived_task_count()
@@ -1,7 +1,7 @@
 """
 Task model
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -28,6 +28,16 @@ class Task(Base):
     """Task entity - belongs to a project, assigned to a user"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Composite indexes for TaskRepository's list filters: each filter
+        # combination has an index whose leading columns it constrains
+        Index("ix_tasks_project_status_priority", "project_id", "status", "priority"),
+        Index("ix_tasks_assignee_status_due", "assignee_id", "status", "due_date"),
+        Index("ix_tasks_status_due", "status", "due_date"),
+        Index("ix_tasks_priority_due", "priority", "due_date"),
+        # Never reuse ids: archived tasks keep theirs and may be moved back
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -36,7 +46,7 @@ class Task(Base):
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    due_date = Column(DateTime(timezone=True), nullable=True)
+    due_date = Column(DateTime(timezone=True), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
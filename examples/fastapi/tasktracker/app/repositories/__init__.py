@@ -1,5 +1,10 @@
 from app.repositories.user_repository import UserRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.task_repository import TaskRepository
+from app.repositories.job_state_repository import JobStateRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
 
-__all__ = ["UserRepository", "ProjectRepository", "TaskRepository"]
+__all__ = [
+    "UserRepository", "ProjectRepository", "TaskRepository",
+    "JobStateRepository", "IdempotencyRepository",
+]
@@ -0,0 +1,67 @@
+"""
+Idempotency key repository - data access layer
+"""
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+
+from app.models.idempotency_key import IdempotencyKey
+
+
+class IdempotencyRepository:
+    """Repository for idempotency keys and their stored responses"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, key: str) -> Optional[IdempotencyKey]:
+        """Get a key record, bypassing any stale copy in the session"""
+        return self.db.get(IdempotencyKey, key, populate_existing=True)
+
+    def try_lock(self, key: str, fingerprint: str, now: datetime, expires_at: datetime) -> bool:
+        """
+        Insert an in-flight record for a key.
+        Returns False if another request already holds the key.
+        """
+        self.db.add(IdempotencyKey(
+            key=key, fingerprint=fingerprint, locked_at=now, expires_at=expires_at
+        ))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return False
+        return True
+
+    def relock(self, record: IdempotencyKey, fingerprint: str, now: datetime,
+               expires_at: datetime) -> None:
+        """Take over an expired or abandoned record"""
+        record.fingerprint = fingerprint
+        record.response_status = None
+        record.response_body = None
+        record.locked_at = now
+        record.expires_at = expires_at
+        self.db.commit()
+
+    def complete(self, key: str, status_code: int, body: str) -> None:
+        """Store the response for a key"""
+        record = self.get(key)
+        record.response_status = status_code
+        record.response_body = body
+        self.db.commit()
+
+    def release(self, key: str) -> None:
+        """Drop an in-flight record so the request can be retried"""
+        self.db.rollback()
+        self.db.execute(delete(IdempotencyKey).where(
+            IdempotencyKey.key == key, IdempotencyKey.response_status.is_(None)
+        ))
+        self.db.commit()
+
+    def delete_expired(self, now: datetime) -> int:
+        """Purge records past their TTL"""
+        result = self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < now))
+        self.db.commit()
+        return result.rowcount
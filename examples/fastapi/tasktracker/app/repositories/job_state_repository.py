@@ -0,0 +1,29 @@
+"""
+Job state repository - data access layer
+"""
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+
+from app.models.job_state import JobState
+
+
+class JobStateRepository:
+    """Repository for background job watermarks"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_watermark(self, name: str) -> Optional[datetime]:
+        """Get the last watermark recorded for a job"""
+        state = self.db.get(JobState, name)
+        return state.watermark if state else None
+
+    def set_watermark(self, name: str, watermark: datetime) -> None:
+        """Record a job's watermark"""
+        state = self.db.get(JobState, name)
+        if state is None:
+            state = JobState(name=name)
+            self.db.add(state)
+        state.watermark = watermark
+        self.db.commit()
@@ -1,10 +1,16 @@
 """
 Project repository - data access layer
 """
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Sequence
 
+from app.core.bulk import bulk_insert
+from app.core.fields import load_only_options
+from app.core.loader import get_loader
+from app.models.archived_task import ArchivedTask
 from app.models.project import Project
+from app.models.task import Task
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
 
@@ -14,9 +20,26 @@ class ProjectRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, project_id: int) -> Optional[Project]:
+    def _query(self, fields: Optional[List[str]] = None):
+        """Base query, restricted to the columns behind `fields` if given"""
+        return self.db.query(Project).options(*load_only_options(Project, fields))
+
+    def get_by_id(self, project_id: int, fields: Optional[List[str]] = None) -> Optional[Project]:
         """Get project by ID"""
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        loader = get_loader(self.db, Project) if fields is None else None
+        if loader is not None:
+            return loader.get(project_id)
+        return self._query(fields).filter(Project.id == project_id).first()
+
+    def get_many(self, project_ids: List[int]) -> Dict[int, Project]:
+        """Get several projects by ID in one query, keyed by ID"""
+        loader = get_loader(self.db, Project)
+        if loader is not None:
+            return loader.get_many(project_ids)
+        return {
+            project.id: project
+            for project in self.db.query(Project).filter(Project.id.in_(project_ids))
+        }
 
     def get_by_owner(self, owner_id: int) -> List[Project]:
         """Get all projects for an owner"""
@@ -26,6 +49,36 @@ class ProjectRepository:
         """Get all projects with pagination"""
         return self.db.query(Project).offset(skip).limit(limit).all()
 
+    def iter_row_batches(
+        self,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        batch_size: int = 1000
+    ) -> Iterator[list]:
+        """
+        Stream plain column rows in batches for list responses.
+        task_count comes from correlated COUNTs over tasks and tasks_archive,
+        not by loading each project's tasks; it matches Project.task_count().
+        """
+        expressions = {
+            name: getattr(Project, name) for name in Project.__table__.columns.keys()
+        }
+        expressions["task_count"] = (
+            select(func.count(Task.id))
+            .where(Task.project_id == Project.id)
+            .scalar_subquery()
+            + select(func.count(ArchivedTask.id))
+            .where(ArchivedTask.project_id == Project.id)
+            .scalar_subquery()
+        )
+
+        query = select(*[expressions[name].label(name) for name in columns])
+        query = query.order_by(Project.id).offset(skip).limit(limit)
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield partition
+
     def create(self, project_data: ProjectCreate) -> Project:
         """Create a new project"""
         project = Project(
@@ -38,6 +91,10 @@ class ProjectRepository:
         self.db.refresh(project)
         return project
 
+    def bulk_create(self, rows: Iterable[dict], chunk_size: int = 10_000) -> int:
+        """Insert many projects from column dicts in one transaction, return the count"""
+        return bulk_insert(self.db, Project.__table__, rows, chunk_size)
+
     def update(self, project: Project, project_data: ProjectUpdate) -> Project:
         """Update an existing project"""
         if project_data.name is not None:
@@ -1,22 +1,58 @@
 """
 Task repository - data access layer
 """
+from sqlalchemy import and_, case, delete, insert, literal, select, union_all
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, Optional, List, Sequence
 
-from app.models.task import Task, TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.core.bulk import bulk_insert
+from app.core.fields import load_only_options
+from app.core.loader import get_loader, reset_loader
+from app.models.archived_task import ArchivedTask
+from app.models.project import Project, ProjectStatus
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.schemas.task import TaskCreate, TaskFilter, TaskSort, TaskUpdate
+
+
+OPEN_STATUSES = [status for status in TaskStatus if status != TaskStatus.DONE]
 
 
 class TaskRepository:
     """Repository for Task data access"""
 
+    # Response fields computed from other columns
+    DERIVED_FIELDS = {"is_overdue": ("due_date", "status")}
+
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, task_id: int) -> Optional[Task]:
+    def _query(self, fields: Optional[List[str]] = None):
+        """Base query, restricted to the columns behind `fields` if given"""
+        return self.db.query(Task).options(
+            *load_only_options(Task, fields, self.DERIVED_FIELDS)
+        )
+
+    def get_archived(self, task_id: int) -> Optional[ArchivedTask]:
+        """Get an archived task by ID"""
+        return self.db.get(ArchivedTask, task_id)
+
+    def get_by_id(self, task_id: int, fields: Optional[List[str]] = None) -> Optional[Task]:
         """Get task by ID"""
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        loader = get_loader(self.db, Task) if fields is None else None
+        if loader is not None:
+            return loader.get(task_id)
+        return self._query(fields).filter(Task.id == task_id).first()
+
+    def get_many(self, task_ids: List[int]) -> Dict[int, Task]:
+        """Get several tasks by ID in one query, keyed by ID"""
+        loader = get_loader(self.db, Task)
+        if loader is not None:
+            return loader.get_many(task_ids)
+        return {
+            task.id: task
+            for task in self.db.query(Task).filter(Task.id.in_(task_ids))
+        }
 
     def get_by_project(self, project_id: int) -> List[Task]:
         """Get all tasks for a project"""
@@ -30,10 +66,193 @@ class TaskRepository:
         """Get all overdue tasks"""
         from datetime import datetime, timezone
         return self.db.query(Task).filter(
-            Task.due_date < datetime.now(timezone.utc),
-            Task.status != TaskStatus.DONE
+            Task.status.in_(OPEN_STATUSES),
+            Task.due_date < datetime.now(timezone.utc)
         ).all()
 
+    def get_due_between(self, after: Optional[datetime], until: datetime) -> list:
+        """
+        Unfinished tasks whose due date falls in (after, until].
+        Range scan on the due_date index; returns plain rows, not ORM objects.
+        """
+        query = select(
+            Task.id, Task.title, Task.project_id, Task.assignee_id, Task.due_date
+        ).where(Task.due_date <= until, Task.status != TaskStatus.DONE)
+        if after is not None:
+            query = query.where(Task.due_date > after)
+        return self.db.execute(query.order_by(Task.due_date, Task.id)).all()
+
+    @staticmethod
+    def _filter_clauses(model, filters: TaskFilter, now: datetime) -> list:
+        """WHERE clauses for a TaskFilter, for Task or ArchivedTask"""
+        clauses = []
+        if filters.project_id is not None:
+            clauses.append(model.project_id == filters.project_id)
+        if filters.assignee_id is not None:
+            clauses.append(model.assignee_id == filters.assignee_id)
+        if filters.status is not None:
+            clauses.append(model.status == filters.status)
+        if filters.priority is not None:
+            clauses.append(model.priority == filters.priority)
+        if filters.due_after is not None:
+            clauses.append(model.due_date >= filters.due_after)
+        if filters.due_before is not None:
+            clauses.append(model.due_date < filters.due_before)
+        if filters.overdue:
+            # IN rather than != so the (status, due_date) index can serve it
+            clauses.append(and_(model.status.in_(OPEN_STATUSES), model.due_date < now))
+        return clauses
+
+    @staticmethod
+    def _sort_key(model, sort: TaskSort):
+        """Primary ORDER BY expression for a TaskSort, None when sorting by id"""
+        if sort in (TaskSort.PRIORITY, TaskSort.PRIORITY_DESC):
+            # Priorities are stored by name, so rank them by declaration order
+            return case(
+                {priority.name: rank for rank, priority in enumerate(TaskPriority)},
+                value=model.priority
+            )
+        if sort in (TaskSort.DUE_DATE, TaskSort.DUE_DATE_DESC):
+            return model.due_date
+        return None
+
+    @staticmethod
+    def _order_by(key, id_column, sort: TaskSort) -> list:
+        """ORDER BY clauses: the sort key, then id to break ties"""
+        if key is None:
+            return [id_column]
+        return [key.desc() if sort.value.startswith("-") else key, id_column]
+
+    def _row_select(self, model, columns: Sequence[str], now: datetime,
+                    filters: TaskFilter, sort: TaskSort, sort_columns: bool = False):
+        """
+        Column select with the filters applied, for Task or ArchivedTask.
+        With sort_columns the sort key and id are added as extra columns so
+        a UNION ALL over both tables can be ordered from outside.
+        """
+        overdue_expr = and_(model.due_date < now, model.status != TaskStatus.DONE)
+        expressions = {name: getattr(model, name) for name in model.__table__.columns.keys()}
+        expressions["is_overdue"] = case((overdue_expr, True), else_=False)
+
+        selected = [expressions[name].label(name) for name in columns]
+        if sort_columns:
+            key = self._sort_key(model, sort)
+            selected.append(model.id.label("sort_id"))
+            if key is not None:
+                selected.append(key.label("sort_key"))
+        return select(*selected).where(*self._filter_clauses(model, filters, now))
+
+    def iter_row_batches(
+        self,
+        columns: Sequence[str],
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSort = TaskSort.ID,
+        limit: Optional[int] = None,
+        include_archived: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[list]:
+        """
+        Stream plain column rows in batches for bulk encoders.
+        Skips ORM instances entirely; is_overdue is computed in SQL.
+        Any combination of filters is served from the composite indexes on
+        tasks. include_archived adds cold rows from tasks_archive via UNION ALL.
+        """
+        now = datetime.now(timezone.utc)
+        filters = filters or TaskFilter()
+
+        if include_archived:
+            combined = union_all(*[
+                self._row_select(model, columns, now, filters, sort, sort_columns=True)
+                for model in (Task, ArchivedTask)
+            ]).subquery()
+            key = combined.c.sort_key if "sort_key" in combined.c else None
+            query = select(*[combined.c[name] for name in columns]).order_by(
+                *self._order_by(key, combined.c.sort_id, sort)
+            )
+        else:
+            # With any filter, sort on id + 0: otherwise SQLite may walk the
+            # whole table in rowid order rather than search a filter index
+            filtered = bool(filters.model_dump(exclude_defaults=True))
+            id_column = Task.id + 0 if filtered else Task.id
+            query = self._row_select(Task, columns, now, filters, sort).order_by(
+                *self._order_by(self._sort_key(Task, sort), id_column, sort)
+            )
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    def _archivable():
+        """WHERE clauses for DONE tasks whose project is archived or completed"""
+        closed_projects = select(Project.id).where(
+            Project.status.in_([ProjectStatus.ARCHIVED, ProjectStatus.COMPLETED])
+        )
+        # Driven from the few closed projects through the (project_id, status) index
+        return [Task.project_id.in_(closed_projects), Task.status == TaskStatus.DONE]
+
+    def get_archivable_ids(self, limit: int) -> List[int]:
+        """IDs of DONE tasks whose project is archived or completed"""
+        query = select(Task.id).where(*self._archivable()).order_by(Task.id).limit(limit)
+        return list(self.db.scalars(query))
+
+    def get_archived_ids(self, project_id: int, limit: int) -> List[int]:
+        """IDs of a project's archived tasks"""
+        query = (
+            select(ArchivedTask.id)
+            .where(ArchivedTask.project_id == project_id)
+            .order_by(ArchivedTask.id)
+            .limit(limit)
+        )
+        return list(self.db.scalars(query))
+
+    def move_to_archive(self, task_ids: List[int], archived_at: datetime) -> int:
+        """
+        Copy tasks into tasks_archive and delete them, in one transaction.
+        The archive conditions are re-checked, so tasks reopened or whose
+        project was reactivated since they were picked stay put.
+        Returns the number of tasks moved.
+        """
+        columns = Task.__table__.columns.keys()
+        source = select(
+            *[getattr(Task, name) for name in columns],
+            literal(archived_at, ArchivedTask.archived_at.type)
+        ).where(Task.id.in_(task_ids), *self._archivable())
+        moved = self.db.execute(
+            insert(ArchivedTask).from_select(columns + ["archived_at"], source)
+        ).rowcount
+        self.db.execute(delete(Task).where(Task.id.in_(task_ids), *self._archivable()))
+        self.db.commit()
+        reset_loader(self.db, Task)
+        return moved
+
+    def restore_from_archive(self, task_ids: List[int]) -> List[int]:
+        """
+        Move archived tasks back into the live table; the caller commits.
+        A task whose id has since been reused by a live task comes back
+        under a new id. Returns the archived ids that were reassigned.
+        """
+        columns = Task.__table__.columns.keys()
+        taken = list(self.db.scalars(select(Task.id).where(Task.id.in_(task_ids))))
+        free = sorted(set(task_ids) - set(taken))
+        if free:
+            source = select(
+                *[getattr(ArchivedTask, name) for name in columns]
+            ).where(ArchivedTask.id.in_(free))
+            self.db.execute(insert(Task).from_select(columns, source))
+        if taken:
+            renumbered = [name for name in columns if name != "id"]
+            source = select(
+                *[getattr(ArchivedTask, name) for name in renumbered]
+            ).where(ArchivedTask.id.in_(taken)).order_by(ArchivedTask.id)
+            self.db.execute(insert(Task).from_select(renumbered, source))
+        self.db.execute(delete(ArchivedTask).where(ArchivedTask.id.in_(task_ids)))
+        reset_loader(self.db, Task)
+        return taken
+
     def count_by_project(self, project_id: int) -> int:
         """Count tasks in a project"""
         return self.db.query(Task).filter(Task.project_id == project_id).count()
@@ -53,6 +272,10 @@ class TaskRepository:
         self.db.refresh(task)
         return task
 
+    def bulk_create(self, rows: Iterable[dict], chunk_size: int = 10_000) -> int:
+        """Insert many tasks from column dicts in one transaction, return the count"""
+        return bulk_insert(self.db, Task.__table__, rows, chunk_size)
+
     def update(self, task: Task, task_data: TaskUpdate) -> Task:
         """Update an existing task"""
         if task_data.title is not None:
@@ -1,9 +1,13 @@
 """
 User repository - data access layer
 """
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Sequence
 
+from app.core.bulk import bulk_insert
+from app.core.fields import load_only_options
+from app.core.loader import get_loader
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -14,9 +18,26 @@ class UserRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, user_id: int) -> Optional[User]:
+    def _query(self, fields: Optional[List[str]] = None):
+        """Base query, restricted to the columns behind `fields` if given"""
+        return self.db.query(User).options(*load_only_options(User, fields))
+
+    def get_by_id(self, user_id: int, fields: Optional[List[str]] = None) -> Optional[User]:
         """Get user by ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        loader = get_loader(self.db, User) if fields is None else None
+        if loader is not None:
+            return loader.get(user_id)
+        return self._query(fields).filter(User.id == user_id).first()
+
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        """Get several users by ID in one query, keyed by ID"""
+        loader = get_loader(self.db, User)
+        if loader is not None:
+            return loader.get_many(user_ids)
+        return {
+            user.id: user
+            for user in self.db.query(User).filter(User.id.in_(user_ids))
+        }
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
@@ -26,6 +47,20 @@ class UserRepository:
         """Get all users with pagination"""
         return self.db.query(User).offset(skip).limit(limit).all()
 
+    def iter_row_batches(
+        self,
+        columns: Sequence[str],
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        batch_size: int = 1000
+    ) -> Iterator[list]:
+        """Stream plain column rows in batches for list responses"""
+        query = select(*[getattr(User, name) for name in columns])
+        query = query.order_by(User.id).offset(skip).limit(limit)
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield partition
+
     def create(self, user_data: UserCreate) -> User:
         """Create a new user"""
         user = User(email=user_data.email, name=user_data.name)
@@ -34,6 +69,10 @@ class UserRepository:
         self.db.refresh(user)
         return user
 
+    def bulk_create(self, rows: Iterable[dict], chunk_size: int = 10_000) -> int:
+        """Insert many users from column dicts in one transaction, return the count"""
+        return bulk_insert(self.db, User.__table__, rows, chunk_size)
+
     def update(self, user: User, user_data: UserUpdate) -> User:
         """Update an existing user"""
         if user_data.name is not None:
@@ -1,9 +1,13 @@
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.schemas.task import TaskCreate, TaskFilter, TaskResponse, TaskSort, TaskUpdate
+from app.schemas.report import BurndownPoint, CycleTimeStats, OverduePoint
+from app.schemas.batch import BatchOperation, BatchRequest, BatchResponse, BatchResult
 
 __all__ = [
     "UserCreate", "UserResponse", "UserUpdate",
     "ProjectCreate", "ProjectResponse", "ProjectUpdate",
-    "TaskCreate", "TaskResponse", "TaskUpdate",
+    "TaskCreate", "TaskResponse", "TaskUpdate", "TaskFilter", "TaskSort",
+    "BurndownPoint", "CycleTimeStats", "OverduePoint",
+    "BatchOperation", "BatchRequest", "BatchResponse", "BatchResult",
 ]
@@ -0,0 +1,32 @@
+"""
+Batch Pydantic schemas for request/response validation
+"""
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class BatchOperation(BaseModel):
+    """One sub-request against an existing route"""
+    method: str
+    path: str
+    body: Optional[Any] = None
+    headers: Dict[str, str] = {}
+
+
+class BatchRequest(BaseModel):
+    """Schema for a batch of sub-requests"""
+    operations: List[BatchOperation]
+    # All-or-nothing: any failed operation rolls back the whole batch
+    atomic: bool = False
+
+
+class BatchResult(BaseModel):
+    """Response of one sub-request"""
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """Schema for batch response"""
+    committed: bool
+    results: List[BatchResult]
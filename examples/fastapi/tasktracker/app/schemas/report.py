@@ -0,0 +1,25 @@
+"""
+Report Pydantic schemas for analytics responses
+"""
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, Optional
+
+
+class BurndownPoint(BaseModel):
+    """Open tasks in a project at the end of a day"""
+    date: date
+    open_tasks: int
+
+
+class OverduePoint(BaseModel):
+    """Overdue tasks in a project at the end of a day"""
+    date: date
+    overdue_tasks: int
+
+
+class CycleTimeStats(BaseModel):
+    """Time-to-done percentiles (hours) for one assignee"""
+    assignee_id: Optional[int]
+    completed: int
+    percentiles: Dict[str, float]
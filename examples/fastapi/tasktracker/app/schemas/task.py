@@ -4,6 +4,7 @@ Task Pydantic schemas for request/response validation
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
+import enum
 from app.models.task import TaskStatus, TaskPriority
 
 
@@ -43,3 +44,23 @@ class TaskResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TaskFilter(BaseModel):
+    """Task list filters; any combination may be set"""
+    project_id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_after: Optional[datetime] = None
+    due_before: Optional[datetime] = None
+    overdue: bool = False
+
+
+class TaskSort(str, enum.Enum):
+    """Task list sort orders; a leading - sorts descending"""
+    ID = "id"
+    PRIORITY = "priority"
+    PRIORITY_DESC = "-priority"
+    DUE_DATE = "due_date"
+    DUE_DATE_DESC = "-due_date"
@@ -1,4 +1,10 @@
 from app.services.task_service import TaskService
 from app.services.notification_service import NotificationService
+from app.services.report_service import ReportService
+from app.services.idempotency_service import IdempotencyService
+from app.services.archive_service import ArchiveService
 
-__all__ = ["TaskService", "NotificationService"]
+__all__ = [
+    "TaskService", "NotificationService", "ReportService",
+    "IdempotencyService", "ArchiveService",
+]
@@ -0,0 +1,98 @@
+"""
+Archive service - moves finished work out of the live tasks table
+
+DONE tasks of archived or completed projects are moved in chunks into
+tasks_archive, so the live table and its indexes only hold active work.
+Re-activating a project moves its tasks back.
+"""
+import logging
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.project import Project
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.schemas.project import ProjectUpdate
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveService:
+    """Service for hot/cold task archival"""
+
+    def __init__(self, db: Session, chunk_size: int = None):
+        self.db = db
+        self.chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+        self.task_repo = TaskRepository(db)
+
+    def archive(self) -> int:
+        """Archive every eligible task, one chunk per transaction"""
+        moved = 0
+        while True:
+            task_ids = self.task_repo.get_archivable_ids(self.chunk_size)
+            if not task_ids:
+                break
+            moved += self.task_repo.move_to_archive(task_ids, datetime.now(timezone.utc))
+        if moved:
+            logger.info(f"Archived {moved} tasks")
+        return moved
+
+    def restore_project(self, project_id: int) -> int:
+        """
+        Move a project's archived tasks back to the live table, chunk by
+        chunk but uncommitted: the caller commits them together with the
+        project's re-activation.
+        """
+        restored = 0
+        reassigned = []
+        while True:
+            task_ids = self.task_repo.get_archived_ids(project_id, self.chunk_size)
+            if not task_ids:
+                break
+            reassigned += self.task_repo.restore_from_archive(task_ids)
+            restored += len(task_ids)
+        if reassigned:
+            logger.warning(
+                f"Restored archived tasks {reassigned} of project {project_id} "
+                f"under new ids; their ids had been reused by live tasks"
+            )
+        return restored
+
+    def reactivate_project(self, project: Project, project_data: ProjectUpdate) -> Project:
+        """
+        Apply an update that re-activates a closed project, restoring its
+        archived tasks in the same transaction. If the restore fails the
+        project stays closed with its archive intact, so the update can
+        simply be retried.
+        """
+        try:
+            self.restore_project(project.id)
+        except Exception:
+            self.db.rollback()
+            raise
+        return ProjectRepository(self.db).update(project, project_data)
+
+
+def run_archiver(stop: threading.Event, interval: float = None) -> None:
+    """Archive every `interval` seconds until `stop` is set"""
+    interval = interval or settings.ARCHIVE_INTERVAL_SECONDS
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            ArchiveService(db).archive()
+        except Exception:
+            logger.exception("Task archival failed")
+        finally:
+            db.close()
+        stop.wait(interval)
+
+
+def start_archiver() -> threading.Event:
+    """Start the archiver on a daemon thread; set the returned event to stop it"""
+    stop = threading.Event()
+    threading.Thread(target=run_archiver, args=(stop,), name="task-archiver", daemon=True).start()
+    return stop
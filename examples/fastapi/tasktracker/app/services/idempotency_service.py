@@ -0,0 +1,110 @@
+"""
+Idempotency service - replays stored responses for retried writes
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+
+def _utc(value: datetime) -> datetime:
+    """SQLite hands back naive datetimes; they are stored as UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def request_fingerprint(method: str, path: str, body: Any) -> str:
+    """Stable hash of a write request"""
+    canonical = json.dumps(jsonable_encoder(body), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{method} {path}\n{canonical}".encode()).hexdigest()
+
+
+class IdempotencyService:
+    """
+    Runs a write at most once per Idempotency-Key.
+    A replay returns the stored response without running the handler, so
+    it touches neither the task tables nor the notification webhook.
+    """
+
+    # Insert attempts when concurrent requests keep taking and releasing the key
+    LOCK_ATTEMPTS = 3
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = IdempotencyRepository(db)
+
+    def execute(self, key: Optional[str], fingerprint: str, handler: Callable[[], Any]) -> Any:
+        """Run handler once for key, or replay its stored response"""
+        if not key:
+            return handler()
+
+        replay = self._acquire(key, fingerprint)
+        if replay is not None:
+            return replay
+
+        try:
+            result = handler()
+        except Exception:
+            # Nothing stored; the client may retry with the same key
+            self.repo.release(key)
+            raise
+
+        self.repo.complete(key, 200, json.dumps(jsonable_encoder(result)))
+        return result
+
+    def _acquire(self, key: str, fingerprint: str) -> Optional[JSONResponse]:
+        """Lock the key for this request, or return the stored response to replay"""
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+
+        record = self.repo.get(key)
+        if record is None:
+            self.repo.delete_expired(now)
+            for _ in range(self.LOCK_ATTEMPTS):
+                if self.repo.try_lock(key, fingerprint, now, expires_at):
+                    return None
+                # Lost the insert race to a concurrent request, whose record
+                # may already be gone again if it failed and was released
+                record = self.repo.get(key)
+                if record is not None:
+                    break
+            else:
+                raise HTTPException(
+                    status_code=409,
+                    detail="A request with this Idempotency-Key is still in progress"
+                )
+
+        if _utc(record.expires_at) < now:
+            self.repo.relock(record, fingerprint, now, expires_at)
+            return None
+
+        if record.fingerprint != fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used for a different request"
+            )
+
+        if record.is_complete():
+            return JSONResponse(
+                content=json.loads(record.response_body),
+                status_code=record.response_status,
+                headers={"Idempotent-Replayed": "true"}
+            )
+
+        lock_timeout = timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS)
+        if now - _utc(record.locked_at) > lock_timeout:
+            # The original request died without finishing
+            self.repo.relock(record, fingerprint, now, expires_at)
+            return None
+
+        raise HTTPException(
+            status_code=409,
+            detail="A request with this Idempotency-Key is still in progress"
+        )
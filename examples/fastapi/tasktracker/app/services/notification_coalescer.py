@@ -0,0 +1,152 @@
+"""
+Notification coalescer - collapses and batches webhook events
+
+Events for the same task inside one batch are merged into a single event
+(e.g. created then completed), and each receiver gets one array payload per
+flush. A batch flushes when it reaches max_batch_size tasks or when its
+oldest event is window_seconds old, whichever comes first.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescerMetrics:
+    """Counters for events in, payloads out and flush latency"""
+
+    def __init__(self):
+        self.events_in = 0
+        self.events_coalesced = 0
+        self.events_out = 0
+        self.payloads_out = 0
+        self.flush_latency_total = 0.0
+        self.flush_latency_max = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values, with average latency derived"""
+        avg = self.flush_latency_total / self.payloads_out if self.payloads_out else 0.0
+        return {
+            "events_in": self.events_in,
+            "events_coalesced": self.events_coalesced,
+            "events_out": self.events_out,
+            "payloads_out": self.payloads_out,
+            "flush_latency_avg_seconds": round(avg, 4),
+            "flush_latency_max_seconds": round(self.flush_latency_max, 4),
+        }
+
+
+class NotificationCoalescer:
+    """
+    Buffers events per receiver and delivers them as array payloads.
+    `send(receiver, payload)` does the actual delivery.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, dict], None],
+        window_seconds: float,
+        max_batch_size: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._send = send
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._clock = clock
+        # receiver -> task key -> merged event, in arrival order
+        self._pending: Dict[str, "OrderedDict[Any, dict]"] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.metrics = CoalescerMetrics()
+
+    def submit(self, receiver: str, event: dict) -> None:
+        """Queue an event; flushes the receiver's batch if it is full"""
+        ready = None
+        with self._lock:
+            self.metrics.events_in += 1
+            batch = self._pending.setdefault(receiver, OrderedDict())
+            if not batch:
+                self._opened_at[receiver] = self._clock()
+
+            key = event.get("task_id")
+            if key is not None and key in batch:
+                merged = batch[key]
+                merged.update({k: v for k, v in event.items() if k != "event"})
+                merged["event"] = event["event"]
+                merged["events"].append(event["event"])
+                self.metrics.events_coalesced += 1
+            else:
+                # Events without a task_id are never merged
+                batch[key if key is not None else object()] = {
+                    **event, "events": [event["event"]]
+                }
+
+            if len(batch) >= self.max_batch_size:
+                ready = self._take(receiver)
+            self._ensure_flusher()
+
+        if ready:
+            self._deliver(*ready)
+
+    def flush_due(self) -> None:
+        """Flush every batch whose oldest event has waited a full window"""
+        now = self._clock()
+        with self._lock:
+            due = [
+                self._take(receiver)
+                for receiver, opened in list(self._opened_at.items())
+                if now - opened >= self.window_seconds
+            ]
+        for batch in due:
+            self._deliver(*batch)
+
+    def flush_all(self) -> None:
+        """Flush everything now, e.g. on shutdown"""
+        with self._lock:
+            ready = [self._take(receiver) for receiver in list(self._opened_at)]
+        for batch in ready:
+            self._deliver(*batch)
+
+    def stop(self) -> None:
+        """Stop the flusher thread and deliver what is pending"""
+        self._stop.set()
+        self.flush_all()
+
+    def _take(self, receiver: str):
+        """Detach a receiver's batch; caller holds the lock"""
+        events = list(self._pending.pop(receiver).values())
+        opened_at = self._opened_at.pop(receiver)
+        return receiver, events, opened_at
+
+    def _deliver(self, receiver: str, events: List[dict], opened_at: float) -> None:
+        """Send one array payload and record metrics"""
+        try:
+            self._send(receiver, {"events": events})
+        except Exception:
+            logger.exception("Failed to deliver coalesced notifications")
+        latency = self._clock() - opened_at
+        with self._lock:
+            self.metrics.events_out += len(events)
+            self.metrics.payloads_out += 1
+            self.metrics.flush_latency_total += latency
+            self.metrics.flush_latency_max = max(self.metrics.flush_latency_max, latency)
+
+    def _ensure_flusher(self) -> None:
+        """Start the time-based flusher on first use; caller holds the lock"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="notification-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Check for due batches several times per window"""
+        interval = max(self.window_seconds / 4, 0.05)
+        while not self._stop.wait(interval):
+            self.flush_due()
@@ -3,12 +3,31 @@ Notification service - sends webhooks for task events
 """
 import httpx
 import logging
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.database import on_commit
 from app.models.task import Task
+from app.services.notification_coalescer import NotificationCoalescer
 
 logger = logging.getLogger(__name__)
 
+_coalescer: Optional[NotificationCoalescer] = None
+
+
+def get_coalescer() -> NotificationCoalescer:
+    """Process-wide coalescer, shared by every NotificationService"""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = NotificationCoalescer(
+            send=lambda url, payload: NotificationService()._send_webhook(payload, url=url),
+            window_seconds=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS,
+            max_batch_size=settings.NOTIFICATION_BATCH_MAX_EVENTS
+        )
+    return _coalescer
+
 
 class NotificationService:
     """
@@ -16,12 +35,16 @@ class NotificationService:
     Wart: No retry logic, failures are silently logged.
     """
 
+    def __init__(self, db: Optional[Session] = None):
+        # Events about db's writes wait until they are committed
+        self.db = db
+
     def send_task_created(self, task: Task) -> None:
         """Send notification when task is created"""
         if not settings.NOTIFICATION_ENABLED:
             return
 
-        self._send_webhook({
+        self._notify({
             "event": "task.created",
             "task_id": task.id,
             "title": task.title,
@@ -33,29 +56,61 @@ class NotificationService:
         if not settings.NOTIFICATION_ENABLED:
             return
 
-        self._send_webhook({
+        self._notify({
             "event": "task.completed",
             "task_id": task.id,
             "title": task.title,
             "project_id": task.project_id
         })
 
-    def _send_webhook(self, payload: dict) -> None:
+    def send_tasks_overdue(
+        self, group_by: str, group_id: Optional[int], tasks: Sequence
+    ) -> None:
+        """Send one notification for a group of tasks that just became overdue"""
+        if not settings.NOTIFICATION_ENABLED:
+            return
+
+        self._send_webhook({
+            "event": "task.overdue",
+            "group_by": group_by,
+            f"{group_by}_id": group_id,
+            "tasks": [
+                {
+                    "task_id": t.id,
+                    "title": t.title,
+                    "project_id": t.project_id,
+                    "assignee_id": t.assignee_id,
+                    "due_date": t.due_date.isoformat(),
+                }
+                for t in tasks
+            ]
+        })
+
+    def _notify(self, payload: dict) -> None:
+        """Deliver a per-task event once the writes behind it are committed"""
+        on_commit(self.db, lambda: self._deliver(payload))
+
+    def _deliver(self, payload: dict) -> None:
+        """Send now, or hand it to the coalescer"""
+        if settings.NOTIFICATION_COALESCE_WINDOW_SECONDS > 0:
+            get_coalescer().submit(settings.NOTIFICATION_WEBHOOK_URL, payload)
+        else:
+            self._send_webhook(payload)
+
+    def _send_webhook(self, payload: dict, url: Optional[str] = None) -> None:
         """
         Send webhook to configured URL.
         Wart: Synchronous HTTP call in async context.
         """
-        if not settings.NOTIFICATION_WEBHOOK_URL:
+        url = url or settings.NOTIFICATION_WEBHOOK_URL
+        if not url:
             logger.warning("Notification webhook URL not configured")
             return
 
         try:
             # Wart: Should use async httpx in production
             with httpx.Client(timeout=5.0) as client:
-                response = client.post(
-                    settings.NOTIFICATION_WEBHOOK_URL,
-                    json=payload
-                )
+                response = client.post(url, json=payload)
                 response.raise_for_status()
         except httpx.HTTPError as e:
             # Wart: Silently fails, no retry
@@ -0,0 +1,89 @@
+"""
+Overdue sweeper - background job that announces tasks crossing their due date
+
+Each sweep only looks at the due_date window since the previous sweep, as an
+index range scan, and persists the new watermark before notifying so a
+restart neither rescans old windows nor notifies twice. The first sweep only
+records its start time, so tasks overdue before then are never announced.
+"""
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.job_state_repository import JobStateRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueSweeper:
+    """
+    Emits task.overdue events, one webhook per project or assignee.
+    Wart: tasks created (or re-dated) with a due date already behind the
+    watermark are never announced.
+    """
+
+    JOB_NAME = "overdue_sweeper"
+    GROUP_BY_OPTIONS = ("project", "assignee")
+
+    def __init__(self, db: Session, group_by: str = None):
+        self.db = db
+        self.group_by = group_by or settings.OVERDUE_SWEEP_GROUP_BY
+        if self.group_by not in self.GROUP_BY_OPTIONS:
+            raise ValueError(f"group_by must be one of {self.GROUP_BY_OPTIONS}")
+        self.task_repo = TaskRepository(db)
+        self.job_repo = JobStateRepository(db)
+        self.notification_service = NotificationService()
+
+    def sweep(self, now: Optional[datetime] = None) -> int:
+        """Run one sweep, return how many tasks became overdue"""
+        now = now or datetime.now(timezone.utc)
+        watermark = self.job_repo.get_watermark(self.JOB_NAME)
+        if watermark is None:
+            # First run: start from now rather than announcing every task
+            # that was already overdue before the sweeper existed
+            self.job_repo.set_watermark(self.JOB_NAME, now)
+            return 0
+        crossed = self.task_repo.get_due_between(watermark, now)
+
+        # Advance first: a crash after this point drops notifications
+        # rather than sending them twice
+        self.job_repo.set_watermark(self.JOB_NAME, now)
+
+        groups = defaultdict(list)
+        for task in crossed:
+            groups[getattr(task, f"{self.group_by}_id")].append(task)
+        for group_id, tasks in groups.items():
+            self.notification_service.send_tasks_overdue(self.group_by, group_id, tasks)
+
+        if crossed:
+            logger.info(f"{len(crossed)} tasks became overdue in {len(groups)} groups")
+        return len(crossed)
+
+
+def run_sweeper(stop: threading.Event, interval: float = None) -> None:
+    """Sweep every `interval` seconds until `stop` is set"""
+    interval = interval or settings.OVERDUE_SWEEP_INTERVAL_SECONDS
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            OverdueSweeper(db).sweep()
+        except Exception:
+            logger.exception("Overdue sweep failed")
+        finally:
+            db.close()
+        stop.wait(interval)
+
+
+def start_sweeper() -> threading.Event:
+    """Start the sweeper on a daemon thread; set the returned event to stop it"""
+    stop = threading.Event()
+    threading.Thread(target=run_sweeper, args=(stop,), name="overdue-sweeper", daemon=True).start()
+    return stop
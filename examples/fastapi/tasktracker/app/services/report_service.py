@@ -0,0 +1,271 @@
+"""
+Report service - vectorized burndown, cycle-time and overdue analytics
+
+Task columns are streamed from the repository in chunks into NumPy arrays,
+and every report is computed with array operations rather than per-task
+Python loops. Results are cached per project and dropped whenever a
+transaction that wrote tasks of that project commits.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import ON_COMMIT_KEY, on_commit
+from app.models.task import Task, TaskStatus
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskFilter
+
+# Columns the reports need, loaded as one array each
+REPORT_COLUMNS = {
+    "status": np.int8,
+    "assignee_id": np.int64,
+    "created_at": "datetime64[s]",
+    "updated_at": "datetime64[s]",
+    "due_date": "datetime64[s]",
+}
+
+STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+DONE = STATUS_CODES[TaskStatus.DONE]
+
+# Stands in for a missing assignee in integer arrays
+NO_ASSIGNEE = -1
+
+
+class ReportCache:
+    """
+    Per-project cache of computed reports.
+    Entries are dropped when task writes for the project commit, when the
+    UTC day their key names has passed, and least recently used first once
+    a project holds max_entries_per_project reports.
+    """
+
+    def __init__(self, max_entries_per_project: int = 32):
+        self.max_entries_per_project = max_entries_per_project
+        self._entries: Dict[int, "OrderedDict[Tuple, Any]"] = {}
+        # Bumped on invalidation so a compute that raced a write isn't stored
+        self._generations: Dict[int, int] = {}
+        self._day: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, project_id: int, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Return the cached report or compute and store it"""
+        with self._lock:
+            self._evict_past_days()
+            project_entries = self._entries.get(project_id)
+            if project_entries is not None and key in project_entries:
+                project_entries.move_to_end(key)
+                return project_entries[key]
+            generation = self._generations.get(project_id, 0)
+        value = compute()
+        with self._lock:
+            self._evict_past_days()
+            if self._generations.get(project_id, 0) == generation and not self._is_past(key):
+                project_entries = self._entries.setdefault(project_id, OrderedDict())
+                project_entries[key] = value
+                if len(project_entries) > self.max_entries_per_project:
+                    project_entries.popitem(last=False)
+        return value
+
+    def _is_past(self, key: Tuple) -> bool:
+        """Whether the key is for a day before today; it can never be hit again"""
+        return any(isinstance(part, date) and part < self._day for part in key)
+
+    def _evict_past_days(self) -> None:
+        """Once per UTC day, drop entries keyed by an earlier day"""
+        today = datetime.utcnow().date()
+        if today == self._day:
+            return
+        self._day = today
+        for project_id, project_entries in list(self._entries.items()):
+            for key in [k for k in project_entries if self._is_past(k)]:
+                del project_entries[key]
+            if not project_entries:
+                del self._entries[project_id]
+
+    def invalidate(self, project_id: int) -> None:
+        """Drop all cached reports for a project"""
+        with self._lock:
+            self._entries.pop(project_id, None)
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drop everything"""
+        with self._lock:
+            self._entries.clear()
+            for project_id in self._generations:
+                self._generations[project_id] += 1
+
+
+report_cache = ReportCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_task_writes(session, flush_context):
+    """Remember which projects had tasks written in this transaction"""
+    touched = session.info.setdefault("report_projects", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Task) and obj.project_id is not None:
+            touched.add(obj.project_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_reports(session):
+    """
+    Invalidate once the writes are visible to other sessions. Inside an
+    atomic batch this commit only released a savepoint, so wait for the
+    batch's own commit.
+    """
+    projects = session.info.pop("report_projects", ())
+    if projects:
+        on_commit(session, lambda: _invalidate(projects))
+
+
+def _invalidate(projects) -> None:
+    for project_id in projects:
+        report_cache.invalidate(project_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_task_writes(session):
+    session.info.pop("report_projects", None)
+
+
+class ReportService:
+    """Service for project analytics"""
+
+    # Rows pulled from the database per chunk
+    CHUNK_SIZE = 10_000
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.task_repo = TaskRepository(db)
+
+    def _cached(self, project_id: int, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Go through report_cache, except inside an atomic batch: its writes
+        are uncommitted and may roll back, so reports on them are not shared.
+        """
+        if self.db.info.get(ON_COMMIT_KEY) is not None:
+            return compute()
+        return report_cache.get_or_compute(project_id, key, compute)
+
+    def _load_columns(self, project_id: int) -> Dict[str, np.ndarray]:
+        """Load the report columns for a project into NumPy arrays, chunk by chunk"""
+        chunks: Dict[str, List[np.ndarray]] = {name: [] for name in REPORT_COLUMNS}
+        batches = self.task_repo.iter_row_batches(
+            list(REPORT_COLUMNS),
+            filters=TaskFilter(project_id=project_id),
+            # Archived tasks are finished work and still count in history
+            include_archived=True,
+            batch_size=self.CHUNK_SIZE
+        )
+        for batch in batches:
+            status, assignee, created, updated, due = zip(*batch)
+            count = len(batch)
+            chunks["status"].append(
+                np.fromiter((STATUS_CODES[s] for s in status), dtype=np.int8, count=count)
+            )
+            chunks["assignee_id"].append(np.fromiter(
+                (NO_ASSIGNEE if a is None else a for a in assignee), dtype=np.int64, count=count
+            ))
+            # SQLite returns naive UTC datetimes; None becomes NaT
+            chunks["created_at"].append(np.array(created, dtype="datetime64[s]"))
+            chunks["updated_at"].append(np.array(updated, dtype="datetime64[s]"))
+            chunks["due_date"].append(np.array(due, dtype="datetime64[s]"))
+
+        return {
+            name: np.concatenate(parts) if parts else np.empty(0, dtype=REPORT_COLUMNS[name])
+            for name, parts in chunks.items()
+        }
+
+    @staticmethod
+    def _done_at(cols: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Completion time per task, NaT for unfinished tasks.
+        Wart: there is no completed_at column, so the last update stands in.
+        """
+        done_at = np.where(np.isnat(cols["updated_at"]), cols["created_at"], cols["updated_at"])
+        return np.where(cols["status"] == DONE, done_at, np.datetime64("NaT"))
+
+    @staticmethod
+    def _day_ends(days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Calendar days ending today (UTC) and the instant each one ends"""
+        today = np.datetime64(datetime.utcnow().date(), "D")
+        dates = today - np.arange(days - 1, -1, -1)
+        return dates, (dates + 1).astype("datetime64[s]")
+
+    @staticmethod
+    def _count_at_or_before(times: np.ndarray, instants: np.ndarray) -> np.ndarray:
+        """For each instant, how many non-NaT times are <= it"""
+        ordered = np.sort(times[~np.isnat(times)])
+        return np.searchsorted(ordered, instants, side="right")
+
+    def burndown(self, project_id: int, days: int = 30) -> List[dict]:
+        """Open tasks at the end of each of the last `days` days"""
+        def compute():
+            cols = self._load_columns(project_id)
+            dates, ends = self._day_ends(days)
+            created = self._count_at_or_before(cols["created_at"], ends)
+            done = self._count_at_or_before(self._done_at(cols), ends)
+            return [
+                {"date": d.item(), "open_tasks": int(n)}
+                for d, n in zip(dates, created - done)
+            ]
+
+        key = ("burndown", days, datetime.utcnow().date())
+        return self._cached(project_id, key, compute)
+
+    def overdue_trend(self, project_id: int, days: int = 30) -> List[dict]:
+        """Overdue tasks at the end of each of the last `days` days"""
+        def compute():
+            cols = self._load_columns(project_id)
+            dates, ends = self._day_ends(days)
+            # A task is overdue from max(due, created) until it is done
+            became_overdue = np.maximum(cols["due_date"], cols["created_at"])
+            stopped = np.maximum(became_overdue, self._done_at(cols))
+            # np.maximum propagates NaT, so only tasks with both times count here
+            overdue = (
+                self._count_at_or_before(became_overdue, ends)
+                - self._count_at_or_before(stopped, ends)
+            )
+            return [
+                {"date": d.item(), "overdue_tasks": int(n)}
+                for d, n in zip(dates, overdue)
+            ]
+
+        key = ("overdue_trend", days, datetime.utcnow().date())
+        return self._cached(project_id, key, compute)
+
+    def cycle_time(self, project_id: int, percentiles: Sequence[float] = (50, 90)) -> List[dict]:
+        """Time-to-done percentiles in hours, per assignee"""
+        percentiles = tuple(percentiles)
+
+        def compute():
+            cols = self._load_columns(project_id)
+            done_at = self._done_at(cols)
+            finished = ~np.isnat(done_at)
+            hours = (done_at[finished] - cols["created_at"][finished]) / np.timedelta64(1, "h")
+            assignees = cols["assignee_id"][finished]
+
+            order = np.argsort(assignees, kind="stable")
+            assignees, hours = assignees[order], hours[order]
+            ids, starts = np.unique(assignees, return_index=True)
+
+            stats = []
+            for assignee_id, group in zip(ids, np.split(hours, starts[1:])):
+                values = np.percentile(group, percentiles)
+                stats.append({
+                    "assignee_id": None if assignee_id == NO_ASSIGNEE else int(assignee_id),
+                    "completed": int(group.size),
+                    "percentiles": {
+                        f"p{p:g}": round(float(v), 2) for p, v in zip(percentiles, values)
+                    },
+                })
+            return stats
+
+        return self._cached(project_id, ("cycle_time", percentiles), compute)
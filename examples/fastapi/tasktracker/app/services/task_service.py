@@ -21,7 +21,7 @@ class TaskService:
         self.db = db
         self.task_repo = TaskRepository(db)
         self.project_repo = ProjectRepository(db)
-        self.notification_service = NotificationService()
+        self.notification_service = NotificationService(db)
 
     def create_task(self, task_data: TaskCreate) -> Task:
         """
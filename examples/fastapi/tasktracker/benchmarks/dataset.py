@@ -0,0 +1,208 @@
+"""
+Synthetic dataset generator for production-sized local runs
+
+Produces users, projects and tasks with skewed shapes: project sizes and
+assignee workloads follow a Zipf-like power law, priorities use fixed
+weights, older tasks are more likely to be done, and due dates fall a few
+weeks after creation with a long tail.
+Output is identical for the same seed and reference date. Rows are loaded
+with the repositories' bulk_create.
+
+Usage:
+    python -m benchmarks.dataset num_tasks db_path [--seed N] [--reference YYYY-MM-DD]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.database import Base
+from app.models.project import ProjectStatus
+from app.models.task import TaskPriority, TaskStatus
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.task_repository import TaskRepository
+from app.repositories.user_repository import UserRepository
+
+TASKS_PER_USER = 200
+TASKS_PER_PROJECT = 500
+
+# Power-law exponents: higher means a few projects/users hold more of the work
+PROJECT_SKEW = 1.1
+ASSIGNEE_SKEW = 0.8
+
+PROJECT_STATUS_WEIGHTS = {
+    ProjectStatus.ACTIVE: 70,
+    ProjectStatus.COMPLETED: 15,
+    ProjectStatus.ARCHIVED: 15,
+}
+# Chance a task is still open decays with its age, down to a floor of
+# forgotten tasks; tasks in closed projects are almost all done
+OPEN_FRACTION_NEW = 0.6
+OPEN_HALF_LIFE_DAYS = 45
+OPEN_FRACTION_FLOOR = 0.02
+CLOSED_PROJECT_OPEN_FRACTION = 0.02
+IN_PROGRESS_SHARE = 1 / 3
+PRIORITY_WEIGHTS = {
+    TaskPriority.LOW: 30,
+    TaskPriority.MEDIUM: 45,
+    TaskPriority.HIGH: 20,
+    TaskPriority.URGENT: 5,
+}
+UNASSIGNED_FRACTION = 0.1
+NO_DUE_DATE_FRACTION = 0.3
+
+# Tasks are created over this many days before the reference date
+HISTORY_DAYS = 730
+
+
+def _power_law_weights(count: int, skew: float) -> List[float]:
+    return [1 / (rank ** skew) for rank in range(1, count + 1)]
+
+
+class DatasetGenerator:
+    """Deterministic users/projects/tasks generator"""
+
+    def __init__(
+        self,
+        num_tasks: int,
+        seed: int = 0,
+        reference: Optional[datetime] = None,
+        num_users: Optional[int] = None,
+        num_projects: Optional[int] = None
+    ):
+        self.num_tasks = num_tasks
+        self.num_users = num_users or max(num_tasks // TASKS_PER_USER, 10)
+        self.num_projects = num_projects or max(num_tasks // TASKS_PER_PROJECT, 5)
+        self.reference = reference or datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self.rng = random.Random(seed)
+
+    def users(self) -> Iterator[dict]:
+        for i in range(1, self.num_users + 1):
+            yield {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "name": f"User {i}",
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS),
+            }
+
+    def projects(self) -> Iterator[dict]:
+        statuses = list(PROJECT_STATUS_WEIGHTS)
+        weights = list(PROJECT_STATUS_WEIGHTS.values())
+        for i in range(1, self.num_projects + 1):
+            yield {
+                "id": i,
+                "name": f"Project {i}",
+                "status": self.rng.choices(statuses, weights)[0],
+                "owner_id": self.rng.randint(1, self.num_users),
+                "created_at": self.reference - timedelta(days=HISTORY_DAYS),
+            }
+
+    def _status(self, project_status: ProjectStatus, age: timedelta) -> TaskStatus:
+        if project_status == ProjectStatus.ACTIVE:
+            decay = 0.5 ** (age.days / OPEN_HALF_LIFE_DAYS)
+            open_fraction = max(OPEN_FRACTION_NEW * decay, OPEN_FRACTION_FLOOR)
+        else:
+            open_fraction = CLOSED_PROJECT_OPEN_FRACTION
+        roll = self.rng.random()
+        if roll >= open_fraction:
+            return TaskStatus.DONE
+        if roll < open_fraction * IN_PROGRESS_SHARE:
+            return TaskStatus.IN_PROGRESS
+        return TaskStatus.TODO
+
+    def tasks(self, project_statuses: List[ProjectStatus]) -> Iterator[dict]:
+        """project_statuses[i] is the status of project i + 1"""
+        rng = self.rng
+        project_ids = list(range(1, self.num_projects + 1))
+        # Shuffle so the biggest projects aren't simply the lowest ids
+        rng.shuffle(project_ids)
+        project_weights = _power_law_weights(self.num_projects, PROJECT_SKEW)
+        user_ids = list(range(1, self.num_users + 1))
+        rng.shuffle(user_ids)
+        user_weights = _power_law_weights(self.num_users, ASSIGNEE_SKEW)
+
+        priorities = list(PRIORITY_WEIGHTS)
+        priority_weights = list(PRIORITY_WEIGHTS.values())
+
+        batch = 10_000
+        for start in range(0, self.num_tasks, batch):
+            size = min(batch, self.num_tasks - start)
+            projects = rng.choices(project_ids, project_weights, k=size)
+            assignees = rng.choices(user_ids, user_weights, k=size)
+            task_priorities = rng.choices(priorities, priority_weights, k=size)
+            for offset in range(size):
+                project_id = projects[offset]
+                age = timedelta(seconds=rng.randint(0, HISTORY_DAYS * 86400))
+                created_at = self.reference - age
+                due_date = None
+                if rng.random() >= NO_DUE_DATE_FRACTION:
+                    # Mostly due within a few weeks of creation, with a long tail
+                    due_date = created_at + timedelta(days=rng.lognormvariate(2.5, 0.8))
+                status = self._status(project_statuses[project_id - 1], age)
+                yield {
+                    "title": f"Task {start + offset + 1}",
+                    "description": "Lorem ipsum dolor sit amet. " * rng.randint(0, 6) or None,
+                    "status": status,
+                    "priority": task_priorities[offset],
+                    "project_id": project_id,
+                    "assignee_id": (
+                        None if rng.random() < UNASSIGNED_FRACTION else assignees[offset]
+                    ),
+                    "due_date": due_date,
+                    "created_at": created_at,
+                    "updated_at": (
+                        created_at + timedelta(hours=rng.expovariate(1 / 72))
+                        if status != TaskStatus.TODO else None
+                    ),
+                }
+
+    def load(self, db: Session) -> None:
+        """
+        Bulk insert everything. ANALYZE is deliberately not run: the app's
+        databases never are, so plans here match theirs.
+        """
+        UserRepository(db).bulk_create(self.users())
+        projects = list(self.projects())
+        ProjectRepository(db).bulk_create(projects)
+        TaskRepository(db).bulk_create(self.tasks([p["status"] for p in projects]))
+
+
+def create_database(url: str):
+    """Engine for url with the schema created"""
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("num_tasks", type=int)
+    parser.add_argument("db_path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reference", type=datetime.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    reference = args.reference and args.reference.replace(tzinfo=timezone.utc)
+    engine = create_database(f"sqlite:///{args.db_path}")
+    db = sessionmaker(bind=engine)()
+    # Durability is irrelevant for a throwaway dataset
+    db.execute(text("PRAGMA synchronous = OFF"))
+    db.execute(text("PRAGMA journal_mode = MEMORY"))
+
+    generator = DatasetGenerator(args.num_tasks, seed=args.seed, reference=reference)
+    start = time.perf_counter()
+    generator.load(db)
+    print(
+        f"{generator.num_users} users, {generator.num_projects} projects, "
+        f"{args.num_tasks} tasks in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
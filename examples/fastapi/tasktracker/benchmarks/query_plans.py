@@ -0,0 +1,250 @@
+"""
+Query-plan and timing regression suite for the repositories
+
+Runs every read query the repositories issue against a generated dataset
+(see benchmarks.dataset), records SQLite's EXPLAIN QUERY PLAN and the best
+of several timed runs, and exits non-zero when a query scans a table it is
+not allowed to scan or exceeds its time budget.
+
+Budgets are for the default dataset size; scale them with --budget-scale
+on slower machines or bigger datasets. The plan checks alone also run under
+pytest, on a small dataset, in tests/test_repository_query_plans.py.
+
+Usage:
+    python -m benchmarks.query_plans [--tasks N] [--db PATH] [--budget-scale X] [--json PATH]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, FrozenSet, List, NamedTuple, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.database import Base
+from app.models import ArchivedTask, Project, Task, User
+from app.models.task import TaskPriority, TaskStatus
+from app.repositories import (
+    IdempotencyRepository,
+    JobStateRepository,
+    ProjectRepository,
+    TaskRepository,
+    UserRepository,
+)
+from app.schemas.task import TaskFilter, TaskSort
+from app.services.archive_service import ArchiveService
+from benchmarks.dataset import DatasetGenerator, create_database
+
+DEFAULT_TASKS = 200_000
+RUNS = 3
+
+SCAN = re.compile(r"^SCAN (\w+)")
+TABLES = set(Base.metadata.tables)
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[Session], object]
+    budget_ms: float
+    # Tables the query may read in full, e.g. an unfiltered paginated list
+    allow_scan: FrozenSet[str] = frozenset()
+
+
+class Result(NamedTuple):
+    name: str
+    best_ms: float
+    budget_ms: float
+    plans: List[List[str]]
+    scanned: List[str]
+
+    @property
+    def passed(self) -> bool:
+        return not self.scanned and self.best_ms <= self.budget_ms
+
+
+def _drain(value) -> None:
+    """Consume generators so lazy queries actually run"""
+    if hasattr(value, "__next__"):
+        for _ in value:
+            pass
+
+
+def _rows(columns: List[str], **kwargs) -> Callable[[Session], object]:
+    return lambda db: TaskRepository(db).iter_row_batches(columns, **kwargs)
+
+
+def build_cases(db: Session) -> List[Case]:
+    """One case per repository read query, with sample arguments from the dataset"""
+    now = datetime.now(timezone.utc)
+    # The biggest project and busiest assignee are the worst cases
+    big_project = db.scalar(
+        select(Task.project_id).group_by(Task.project_id).order_by(func.count().desc()).limit(1)
+    )
+    busy_user = db.scalar(
+        select(Task.assignee_id).where(Task.assignee_id.is_not(None))
+        .group_by(Task.assignee_id).order_by(func.count().desc()).limit(1)
+    )
+    closed_project = db.scalar(
+        select(ArchivedTask.project_id).group_by(ArchivedTask.project_id)
+        .order_by(func.count().desc()).limit(1)
+    )
+    task_ids = list(range(1, 1001, 10))
+    email = db.scalar(select(User.email).order_by(User.id.desc()).limit(1))
+    owner = db.scalar(select(Project.owner_id).limit(1))
+    list_columns = ["id", "title", "status", "priority", "due_date", "is_overdue"]
+    week = (now, now + timedelta(days=7))
+
+    return [
+        Case("user.get_by_id", lambda db: UserRepository(db).get_by_id(busy_user), 5),
+        Case("user.get_many", lambda db: UserRepository(db).get_many(task_ids), 10),
+        Case("user.get_by_email", lambda db: UserRepository(db).get_by_email(email), 5),
+        Case("user.get_all", lambda db: UserRepository(db).get_all(), 10, frozenset({"users"})),
+        Case("user.iter_row_batches",
+             lambda db: UserRepository(db).iter_row_batches(["id", "name"]), 10,
+             frozenset({"users"})),
+        Case("project.get_by_id", lambda db: ProjectRepository(db).get_by_id(big_project), 5),
+        Case("project.get_many", lambda db: ProjectRepository(db).get_many(task_ids), 10),
+        Case("project.get_by_owner", lambda db: ProjectRepository(db).get_by_owner(owner), 5),
+        Case("project.get_all", lambda db: ProjectRepository(db).get_all(), 10,
+             frozenset({"projects"})),
+        Case("project.iter_row_batches",
+             lambda db: ProjectRepository(db).iter_row_batches(["id", "name", "task_count"]), 100,
+             frozenset({"projects"})),
+        Case("task.get_by_id", lambda db: TaskRepository(db).get_by_id(task_ids[-1]), 5),
+        Case("task.get_many", lambda db: TaskRepository(db).get_many(task_ids), 10),
+        Case("task.get_archived", lambda db: TaskRepository(db).get_archived(task_ids[-1]), 5),
+        Case("task.get_by_project",
+             lambda db: TaskRepository(db).get_by_project(big_project), 1500),
+        Case("task.get_by_assignee",
+             lambda db: TaskRepository(db).get_by_assignee(busy_user), 300),
+        Case("task.get_overdue", lambda db: TaskRepository(db).get_overdue(), 200),
+        Case("task.get_due_between",
+             lambda db: TaskRepository(db).get_due_between(now - timedelta(days=1), now), 20),
+        Case("task.count_by_project",
+             lambda db: TaskRepository(db).count_by_project(big_project), 50),
+        Case("task.get_archivable_ids",
+             lambda db: TaskRepository(db).get_archivable_ids(500), 10,
+             frozenset({"projects"})),
+        Case("task.get_archived_ids",
+             lambda db: TaskRepository(db).get_archived_ids(closed_project, 500), 10),
+        Case("task.rows.default_list", _rows(list_columns, limit=100), 10, frozenset({"tasks"})),
+        Case("task.rows.project", _rows(list_columns, filters=TaskFilter(
+            project_id=big_project)), 600),
+        Case("task.rows.assignee", _rows(list_columns, filters=TaskFilter(
+            assignee_id=busy_user)), 100),
+        Case("task.rows.project_assignee", _rows(list_columns, filters=TaskFilter(
+            project_id=big_project, assignee_id=busy_user)), 100),
+        Case("task.rows.project_status_priority", _rows(list_columns, filters=TaskFilter(
+            project_id=big_project, status=TaskStatus.TODO, priority=TaskPriority.URGENT)), 20),
+        Case("task.rows.assignee_status_due", _rows(list_columns, filters=TaskFilter(
+            assignee_id=busy_user, status=TaskStatus.IN_PROGRESS,
+            due_after=week[0], due_before=week[1])), 20),
+        Case("task.rows.status_due", _rows(list_columns, filters=TaskFilter(
+            status=TaskStatus.TODO, due_after=week[0], due_before=week[1])), 50),
+        Case("task.rows.priority_sorted", _rows(list_columns, filters=TaskFilter(
+            project_id=big_project, status=TaskStatus.TODO), sort=TaskSort.PRIORITY_DESC), 200),
+        Case("task.rows.overdue", _rows(list_columns, filters=TaskFilter(overdue=True)), 100),
+        Case("task.rows.project_with_archive", _rows(list_columns, filters=TaskFilter(
+            project_id=closed_project), include_archived=True), 200),
+        Case("job_state.get_watermark",
+             lambda db: JobStateRepository(db).get_watermark("overdue_sweeper"), 5),
+        Case("idempotency.get", lambda db: IdempotencyRepository(db).get("missing"), 5),
+    ]
+
+
+def run_case(session_factory, engine, case: Case, budget_scale: float) -> Result:
+    """Capture the statements a case issues, explain them, then time it"""
+    statements: List[Tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    db = session_factory()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        _drain(case.run(db))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        db.close()
+
+    plans, scanned = [], []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plan = [row[-1] for row in rows]
+            plans.append(plan)
+            for detail in plan:
+                match = SCAN.match(detail)
+                if match and match.group(1) in TABLES and match.group(1) not in case.allow_scan:
+                    scanned.append(detail)
+
+    timings = []
+    for _ in range(RUNS):
+        db = session_factory()
+        try:
+            start = time.perf_counter()
+            _drain(case.run(db))
+            timings.append(time.perf_counter() - start)
+        finally:
+            db.close()
+
+    return Result(
+        case.name, min(timings) * 1000, case.budget_ms * budget_scale, plans, scanned
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS)
+    parser.add_argument("--db", help="reuse or create the dataset at this path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    parser.add_argument("--json", help="write results to this path")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "query_plans.db")
+    exists = os.path.exists(path)
+    engine = create_database(f"sqlite:///{path}")
+    session_factory = sessionmaker(bind=engine)
+    if not exists:
+        db = session_factory()
+        DatasetGenerator(args.tasks, seed=args.seed).load(db)
+        # Split hot/cold the way the archiver would in production
+        ArchiveService(db, chunk_size=10_000).archive()
+        db.close()
+
+    db = session_factory()
+    cases = build_cases(db)
+    db.close()
+
+    results = [run_case(session_factory, engine, case, args.budget_scale) for case in cases]
+
+    print(f"{'query':<40}{'best ms':>10}{'budget':>10}  status")
+    for result in results:
+        status = "ok" if result.passed else "FAIL"
+        print(f"{result.name:<40}{result.best_ms:>10.2f}{result.budget_ms:>10.0f}  {status}")
+        for detail in result.scanned:
+            print(f"    full scan: {detail}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([
+                {**result._asdict(), "passed": result.passed} for result in results
+            ], f, indent=2)
+
+    failed = [result.name for result in results if not result.passed]
+    if failed:
+        print(f"{len(failed)} of {len(results)} queries regressed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"all {len(results)} queries within plan and time budgets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: JSON vs MessagePack vs Arrow IPC for bulk task responses
+
+Seeds an in-memory SQLite database and measures encode time, decode time
+and payload size for each format.
+
+Usage:
+    python -m benchmarks.response_formats [num_tasks]
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.tasks import TASK_COLUMNS
+from app.core.database import Base
+from app.core.formats import encode_msgpack, iter_arrow_stream
+from app.models import Project, Task, User
+from app.models.task import TaskPriority, TaskStatus
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskResponse
+
+
+def seed(db, num_tasks: int) -> None:
+    """Insert one user, one project and num_tasks tasks"""
+    db.execute(insert(User), [{"email": "bench@example.com", "name": "Bench"}])
+    db.execute(insert(Project), [{"name": "Bench", "owner_id": 1}])
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    now = datetime.utcnow()
+    db.execute(insert(Task), [
+        {
+            "title": f"Task {i}",
+            "description": "Lorem ipsum dolor sit amet. " * 8,
+            "status": statuses[i % len(statuses)],
+            "priority": priorities[i % len(priorities)],
+            "project_id": 1,
+            "assignee_id": 1,
+            "due_date": now + timedelta(days=i % 30 - 15),
+            "created_at": now,
+        }
+        for i in range(num_tasks)
+    ])
+    db.commit()
+
+
+def timed(fn):
+    """Run fn once, return (result, seconds)"""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(num_tasks: int) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    seed(db, num_tasks)
+    repo = TaskRepository(db)
+    names = [name for name, _ in TASK_COLUMNS]
+
+    def json_orm():
+        # Current JSON path: ORM rows -> TaskResponse -> JSON
+        db.expunge_all()
+        tasks = db.query(Task).all()
+        # is_overdue left at its default: Task.is_overdue() can't compare
+        # SQLite's naive timestamps against an aware "now"
+        body = [
+            TaskResponse(**{name: getattr(t, name) for name in names[:-1]}).model_dump()
+            for t in tasks
+        ]
+        return json.dumps(jsonable_encoder(body)).encode()
+
+    def msgpack_rows():
+        return encode_msgpack(TASK_COLUMNS, repo.iter_row_batches(names))
+
+    def arrow_rows():
+        return b"".join(iter_arrow_stream(TASK_COLUMNS, repo.iter_row_batches(names)))
+
+    import msgpack
+    import pyarrow as pa
+
+    cases = [
+        ("json", json_orm, json.loads),
+        ("msgpack", msgpack_rows, lambda b: msgpack.unpackb(b, timestamp=3)),
+        ("arrow", arrow_rows, lambda b: pa.ipc.open_stream(b).read_all()),
+    ]
+
+    print(f"{num_tasks} tasks")
+    print(f"{'format':<10}{'encode ms':>12}{'decode ms':>12}{'bytes':>14}")
+    for name, encode, decode in cases:
+        payload, encode_s = timed(encode)
+        _, decode_s = timed(lambda: decode(payload))
+        print(f"{name:<10}{encode_s * 1000:>12.1f}{decode_s * 1000:>12.1f}{len(payload):>14,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,75 @@
+"""
+Benchmark: ORM list path vs Core row projection path
+
+Compares peak memory per 10k rows and rows/sec for encoding the task list
+JSON body from ORM instances + TaskResponse versus plain column rows
+mapped straight to response dicts.
+
+Usage:
+    python -m benchmarks.row_projection [num_tasks]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.tasks import TASK_COLUMNS
+from app.core.database import Base
+from app.core.formats import encode_json
+from app.models import Task
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskResponse
+from benchmarks.response_formats import seed
+
+
+def measure(fn):
+    """Run fn once, return (seconds, peak bytes allocated)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(num_tasks: int) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    seed(db, num_tasks)
+    repo = TaskRepository(db)
+    names = [name for name, _ in TASK_COLUMNS]
+
+    def orm_path():
+        # Previous list path: identity-mapped instances copied into TaskResponse
+        db.expunge_all()
+        tasks = db.query(Task).all()
+        body = [
+            TaskResponse(**{name: getattr(t, name) for name in names[:-1]}).model_dump()
+            for t in tasks
+        ]
+        return json.dumps(jsonable_encoder(body)).encode()
+
+    def row_path():
+        return encode_json(TASK_COLUMNS, repo.iter_row_batches(names))
+
+    print(f"{num_tasks} tasks")
+    print(f"{'path':<8}{'rows/sec':>14}{'peak MB / 10k rows':>22}")
+    for name, fn in [("orm", orm_path), ("rows", row_path)]:
+        elapsed, peak = measure(fn)
+        per_10k = peak / num_tasks * 10_000 / 1024 / 1024
+        print(f"{name:<8}{num_tasks / elapsed:>14,.0f}{per_10k:>22.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
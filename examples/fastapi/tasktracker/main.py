@@ -2,8 +2,13 @@
 TaskTracker API - Main entry point
 """
 from fastapi import FastAPI
-from app.api import projects, tasks, users
+from app.api import batch, projects, reports, tasks, users
+from app.core.config import settings
 from app.core.database import engine, Base
+from app.core.profiling import install_profiling
+from app.services.archive_service import start_archiver
+from app.services.notification_service import get_coalescer
+from app.services.overdue_sweeper import start_sweeper
 
 # Create tables on startup - not recommended for production
 # but fine for this example app
@@ -19,9 +24,41 @@ app = FastAPI(
 app.include_router(users.router, prefix="/users", tags=["users"])
 app.include_router(projects.router, prefix="/projects", tags=["projects"])
 app.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
+app.include_router(reports.router, prefix="/reports", tags=["reports"])
+app.include_router(batch.router, prefix="/batch", tags=["batch"])
+
+# Opt-in: nothing is wrapped unless a token or sample rate is configured
+if settings.PROFILING_TOKEN or settings.PROFILING_SAMPLE_RATE > 0:
+    install_profiling(app)
+
+
+@app.on_event("startup")
+def start_background_jobs():
+    """Start opt-in background jobs"""
+    if settings.OVERDUE_SWEEP_ENABLED:
+        app.state.stop_overdue_sweeper = start_sweeper()
+    if settings.ARCHIVE_ENABLED:
+        app.state.stop_archiver = start_archiver()
+
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    """Signal background jobs to stop"""
+    for name in ("stop_overdue_sweeper", "stop_archiver"):
+        stop = getattr(app.state, name, None)
+        if stop is not None:
+            stop.set()
+    if settings.NOTIFICATION_COALESCE_WINDOW_SECONDS > 0:
+        get_coalescer().stop()
 
 
 @app.get("/health")
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics/notifications")
+def notification_metrics():
+    """Notification coalescing counters"""
+    return get_coalescer().metrics.snapshot()
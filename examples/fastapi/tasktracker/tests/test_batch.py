@@ -0,0 +1,83 @@
+"""
+Tests for the batch endpoint's in-process sub-request dispatch
+"""
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api import batch, users
+from app.core import database
+from app.core.config import settings
+from app.core.database import Base
+from app.core.profiling import install_profiling
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(database, "engine", engine)
+    return engine
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.include_router(batch.router, prefix="/batch")
+    return app
+
+
+@pytest.mark.parametrize("atomic", [False, True])
+def test_batch_bodies_survive_http_middleware(engine, atomic):
+    app = make_app()
+
+    # BaseHTTPMiddleware stops streaming the response if it sees a disconnect
+    @app.middleware("http")
+    async def passthrough(request: Request, call_next):
+        return await call_next(request)
+
+    response = TestClient(app).post("/batch/", json={
+        "atomic": atomic,
+        "operations": [
+            {"method": "POST", "path": "/users/",
+             "body": {"email": "a@example.com", "name": "A"}},
+            {"method": "GET", "path": "/users/1"},
+            {"method": "GET", "path": "/users/"},
+        ],
+    })
+
+    assert response.status_code == 200
+    assert response.json()["committed"] is True
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 200, 200]
+    assert results[0]["body"]["email"] == "a@example.com"
+    assert results[1]["body"]["id"] == 1
+    assert [u["email"] for u in results[2]["body"]] == ["a@example.com"]
+
+
+def test_profiled_batch_keeps_sub_request_bodies(engine, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILING_TOKEN", "secret")
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    app = make_app()
+    install_profiling(app)
+
+    response = TestClient(app).post("/batch/", headers={"X-Profile": "secret"}, json={
+        "operations": [
+            {"method": "POST", "path": "/users/",
+             "body": {"email": "a@example.com", "name": "A"}},
+            {"method": "GET", "path": "/users/"},
+        ],
+    })
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["body"]["email"] == "a@example.com"
+    assert [u["email"] for u in results[1]["body"]] == ["a@example.com"]
+    stem = response.headers["X-Profile-Id"]
+    assert (tmp_path / f"{stem}.summary.json").exists()
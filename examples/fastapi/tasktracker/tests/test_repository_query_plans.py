@@ -0,0 +1,47 @@
+"""
+Query-plan regression checks for every repository read query
+
+Runs benchmarks.query_plans' cases against a small generated dataset and
+fails when a query scans a table it is not allowed to scan. Timing budgets
+are left to the CLI (python -m benchmarks.query_plans).
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.services.archive_service import ArchiveService
+from benchmarks.dataset import DatasetGenerator, create_database
+from benchmarks.query_plans import build_cases, run_case
+
+NUM_TASKS = 5_000
+REFERENCE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    path = tmp_path_factory.mktemp("query_plans") / "dataset.db"
+    engine = create_database(f"sqlite:///{path}")
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    DatasetGenerator(NUM_TASKS, seed=0, reference=REFERENCE).load(db)
+    ArchiveService(db, chunk_size=10_000).archive()
+    db.close()
+    yield engine, session_factory
+    engine.dispose()
+
+
+def test_repository_queries_use_indexes(dataset):
+    engine, session_factory = dataset
+    db = session_factory()
+    cases = build_cases(db)
+    db.close()
+
+    scanned = {}
+    for case in cases:
+        result = run_case(session_factory, engine, case, budget_scale=1.0)
+        assert result.plans, f"{case.name} issued no SELECT"
+        if result.scanned:
+            scanned[case.name] = result.scanned
+
+    assert scanned == {}
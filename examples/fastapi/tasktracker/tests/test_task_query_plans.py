@@ -0,0 +1,92 @@
+"""
+Query-plan tests for TaskRepository's list filters
+
+Every combination of TaskFilter fields must be served from an index:
+the statement iter_row_batches issues is run through EXPLAIN QUERY PLAN
+and no step may scan the tasks table.
+"""
+from datetime import datetime, timedelta, timezone
+from itertools import combinations
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.task import TaskPriority, TaskStatus
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskFilter, TaskSort
+
+NOW = datetime.now(timezone.utc)
+
+FILTER_VALUES = {
+    "project_id": 1,
+    "assignee_id": 1,
+    "status": TaskStatus.TODO,
+    "priority": TaskPriority.HIGH,
+    "due_after": NOW,
+    "due_before": NOW + timedelta(days=7),
+    "overdue": True,
+}
+
+FILTER_SHAPES = [
+    combo
+    for size in range(1, len(FILTER_VALUES) + 1)
+    for combo in combinations(FILTER_VALUES, size)
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def query_plan(engine, filters: TaskFilter, sort: TaskSort = TaskSort.ID) -> list:
+    """EXPLAIN QUERY PLAN details for the statement iter_row_batches runs"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    db = sessionmaker(bind=engine)()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        list(TaskRepository(db).iter_row_batches(["id", "title"], filters=filters, sort=sort))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        db.close()
+
+    (statement, parameters), = statements
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_index(plan: list) -> None:
+    searches = [detail for detail in plan if detail.startswith("SEARCH tasks USING")]
+    scans = [detail for detail in plan if detail.startswith("SCAN tasks")]
+    assert searches and not scans, plan
+
+
+@pytest.mark.parametrize("shape", FILTER_SHAPES, ids="+".join)
+def test_filter_shape_uses_index(engine, shape):
+    filters = TaskFilter(**{name: FILTER_VALUES[name] for name in shape})
+    assert_uses_index(query_plan(engine, filters))
+
+
+@pytest.mark.parametrize("sort", list(TaskSort), ids=lambda s: s.value)
+def test_sorted_filter_uses_index(engine, sort):
+    filters = TaskFilter(project_id=1, status=TaskStatus.TODO)
+    assert_uses_index(query_plan(engine, filters, sort))
+
+
+def test_unfiltered_list_scans(engine):
+    # The only shape allowed to scan: the capped default list
+    assert query_plan(engine, TaskFilter()) == ["SCAN tasks"]